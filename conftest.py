@@ -4,7 +4,9 @@ Pytest configuration and fixtures for the automation framework.
 
 import logging
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Generator
 from unittest.mock import Mock
@@ -19,15 +21,25 @@ from utils.api_client import APIClient
 
 # Import framework modules
 from utils.config_manager import ConfigManager
-from utils.logger import setup_logger
+from utils.logger import configure_default
 from utils.webdriver_manager import WebDriverManager
 
 # Setup logging
-logger = setup_logger()
+logger = configure_default()
 
 # Load configuration
 config = ConfigManager()
 
+# Ad and analytics hosts blocked in Chromium browsers; tests never need them
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*adservice.google.com*",
+]
+
 
 @pytest.fixture(scope="session")
 def test_config() -> Dict[str, Any]:
@@ -47,9 +59,14 @@ def web_base_url(test_config) -> str:
     return test_config.get("web", {}).get("base_url", "http://localhost:3000")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def driver(request) -> Generator:
-    """Provide WebDriver instance for web tests."""
+    """
+    Provide a WebDriver instance shared by all web tests in the session.
+
+    Browser startup dominates the runtime of short E2E tests, so a single
+    browser is reused and ``reset_browser_state`` cleans it between tests.
+    """
     import signal
     from selenium.common.exceptions import WebDriverException
     
@@ -62,19 +79,28 @@ def driver(request) -> Generator:
     # Set different timeouts for CI vs local
     setup_timeout = 60 if is_ci else 30  # More time for CI setup
     page_load_timeout = 15 if is_ci else 30  # Even faster timeouts for CI to prevent hanging
-    implicit_wait = 3 if is_ci else 10  # Very fast implicit waits for CI
+    implicit_wait = 2  # Single short implicit wait; long waits use explicit WebDriverWait
     script_timeout = 10 if is_ci else 20  # Conservative script timeout for CI
     
     # Set a timeout for WebDriver setup
     signal.signal(signal.SIGALRM, timeout_handler)
     signal.alarm(setup_timeout)
     
+    profile_dir = None
     try:
         print(f"🔧 Initializing WebDriver... (CI: {is_ci})")
         driver_manager = WebDriverManager()
-        driver = driver_manager.get_driver()
-
-        # Set implicit wait (shorter for CI)
+        driver_options = {}
+        if config.get("browser.name", "chrome").lower() == "chrome":
+            # Fresh profile per run and xdist worker so Chromes don't fight over the lock
+            worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+            profile_dir = tempfile.mkdtemp(prefix=f"chrome-{worker_id}-")
+            driver_options["user-data-dir"] = profile_dir
+        if request.config.getoption("--headless"):
+            driver_options["headless"] = True
+        driver = driver_manager.get_driver(**driver_options)
+
+        # Set implicit wait
         driver.implicitly_wait(implicit_wait)
 
         # Set window size
@@ -85,6 +111,14 @@ def driver(request) -> Generator:
         
         # Set script timeout (conservative for CI)
         driver.set_script_timeout(script_timeout)
+
+        # Fail ad/tracker requests instantly (Chromium only, via CDP)
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            except WebDriverException as e:
+                print(f"⚠️ Could not block ad hosts: {e}")
         
         print("✅ WebDriver initialized successfully")
         signal.alarm(0)  # Cancel the alarm
@@ -114,6 +148,29 @@ def driver(request) -> Generator:
                 print("✅ WebDriver cleanup completed")
         except Exception as e:
             print(f"⚠️ Warning: WebDriver cleanup failed: {e}")
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_browser_state(request) -> Generator:
+    """
+    Clear cookies and web storage after each test using the shared driver.
+
+    The page is left where it is so the next test can skip reloading it.
+    """
+    if "driver" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("driver")
+    yield
+    try:
+        driver.delete_all_cookies()
+        driver.execute_script(
+            "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+        )
+    except Exception as e:
+        logger.warning(f"Failed to reset browser state: {e}")
 
 
 @pytest.fixture(scope="function")
@@ -216,6 +273,22 @@ def generate_test_data():
 
 
 # Pytest hooks
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--check-overlays",
+        action="store_true",
+        default=False,
+        help="Run the overlay dismissal probe in smoke tests (scans every candidate overlay selector)",
+    )
+    parser.addoption(
+        "--headless",
+        action="store_true",
+        default=False,
+        help="Force the browser to run headless regardless of configuration",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
     # Add custom markers
@@ -224,6 +297,9 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "api: marks tests as API tests")
     config.addinivalue_line("markers", "ui: marks tests as UI tests")
     config.addinivalue_line("markers", "unit: marks tests as unit tests")
+
+    # Page HTML dumps on failure land here; created once rather than per dump
+    os.makedirs("logs", exist_ok=True)
     
     # Set default timeout for all tests
     config.addinivalue_line("addopts", "--timeout=300")
@@ -2,13 +2,16 @@
 Base page object class with common web element interactions.
 """
 
+import json
 import time
+from contextlib import contextmanager
 from typing import List, Optional, Tuple
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
     NoSuchElementException,
     TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -87,6 +90,21 @@ class BasePage:
         except Exception as e:
             logger.debug(f"Could not dismiss overlays: {e}")
 
+    @contextmanager
+    def without_implicit_wait(self):
+        """
+        Temporarily disable the driver's implicit wait.
+
+        Explicit waits poll find_element, so a non-zero implicit wait stretches
+        every poll and makes the effective timeout unpredictable.
+        """
+        implicit_wait = self.driver.timeouts.implicit_wait
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+
     def find_element(self, locator: Tuple[str, str], timeout: int = 20) -> WebElement:
         """Find element with explicit wait."""
         try:
@@ -247,6 +265,33 @@ class BasePage:
         except TimeoutException:
             return False
 
+    def wait_for_element_enabled(self, element_id: str, timeout: int = 20) -> bool:
+        """
+        Wait for element to become enabled.
+
+        On Chromium drivers the polling runs inside the browser via CDP
+        Runtime.evaluate, so the whole wait costs a single round trip.
+        Other drivers fall back to the explicit clickable wait.
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return self.is_element_clickable((By.ID, element_id), timeout)
+
+        expression = (
+            "new Promise(r=>{const end=Date.now()+%d;const i=setInterval(()=>{"
+            "const b=document.getElementById(%s);"
+            "if(b && !b.disabled){clearInterval(i);r(true);}"
+            "else if(Date.now()>end){clearInterval(i);r(false);}},50);})"
+        ) % (timeout * 1000, json.dumps(element_id))
+        try:
+            response = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {"expression": expression, "awaitPromise": True, "returnByValue": True},
+            )
+        except WebDriverException as e:
+            logger.debug(f"CDP wait unavailable, falling back to polling: {e}")
+            return self.is_element_clickable((By.ID, element_id), timeout)
+        return bool(response.get("result", {}).get("value"))
+
     def wait_for_element_to_disappear(
         self, locator: Tuple[str, str], timeout: int = 20
     ) -> bool:
@@ -2,7 +2,9 @@
 Page objects for DemoQA practice site.
 """
 
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.base_page import BasePage
 
@@ -91,6 +93,36 @@ class DemoQATextBoxPage(BasePage):
     SUBMIT_BUTTON = (By.CSS_SELECTOR, "#submit")
     OUTPUT_DIV = (By.CSS_SELECTOR, "#output")
 
+    # fill_form_bulk data keys mapped to input element ids
+    FORM_FIELD_IDS = {
+        "full_name": "userName",
+        "email": "userEmail",
+        "current_address": "currentAddress",
+        "permanent_address": "permanentAddress",
+    }
+
+    # Sets values through the native prototype setter so React's value tracker
+    # sees the change, then fires the input events React listens for.
+    _FILL_FORM_SCRIPT = """
+        const fields = arguments[0], data = arguments[1];
+        for (const [key, id] of Object.entries(fields)) {
+            const el = document.getElementById(id);
+            if (!el) return id;
+            const proto = el instanceof HTMLTextAreaElement
+                ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, "value").set.call(el, data[key]);
+            el.dispatchEvent(new Event("input", {bubbles: true}));
+        }
+        return null;
+    """
+
+    # #output is rendered empty until the form is submitted
+    _OUTPUT_STATE_SCRIPT = """
+        const e = document.querySelector("#output");
+        const text = e ? e.innerText.trim() : "";
+        return {present: text !== "", text: text};
+    """
+
     def fill_form(self, full_name, email, current_address, permanent_address):
         """Fill the text box form."""
         self.type_text(self.FULL_NAME_INPUT, full_name, timeout=20)
@@ -98,17 +130,50 @@ class DemoQATextBoxPage(BasePage):
         self.type_text(self.CURRENT_ADDRESS_INPUT, current_address, timeout=20)
         self.type_text(self.PERMANENT_ADDRESS_INPUT, permanent_address, timeout=20)
 
+    def fill_form_bulk(self, data):
+        """Fill the text box form from a dict in a single script call."""
+        self.find_element(self.FULL_NAME_INPUT, timeout=20)
+        fields = {
+            key: field_id
+            for key, field_id in self.FORM_FIELD_IDS.items()
+            if key in data
+        }
+        missing = self.driver.execute_script(self._FILL_FORM_SCRIPT, fields, data)
+        if missing:
+            raise NoSuchElementException(f"Form field not found: #{missing}")
+
     def submit_form(self):
         """Submit the form."""
         self.click_element(self.SUBMIT_BUTTON, timeout=20)
 
     def get_output_text(self):
         """Get the output text after form submission."""
-        return self.get_text(self.OUTPUT_DIV, timeout=20)
+        with self.without_implicit_wait():
+            return self.get_text(self.OUTPUT_DIV, timeout=20)
 
     def is_output_present(self):
         """Check if output is present."""
-        return self.is_element_present(self.OUTPUT_DIV, timeout=20)
+        with self.without_implicit_wait():
+            return self.is_element_present(self.OUTPUT_DIV, timeout=20)
+
+    def get_output_state(self, timeout=20):
+        """
+        Wait for the submission output and return it as {"present", "text"}.
+
+        Each poll reads presence and text in one script call; after the timeout
+        the last state read is returned.
+        """
+        state = {"present": False, "text": ""}
+
+        def output_rendered(driver):
+            state.update(driver.execute_script(self._OUTPUT_STATE_SCRIPT))
+            return state["present"]
+
+        try:
+            WebDriverWait(self.driver, timeout).until(output_rendered)
+        except TimeoutException:
+            pass
+        return state
 
 
 class DemoQADynamicPropertiesPage(BasePage):
@@ -121,7 +186,7 @@ class DemoQADynamicPropertiesPage(BasePage):
 
     def wait_for_button_enabled(self, timeout=20):
         """Wait for button to be enabled."""
-        return self.is_element_clickable(self.ENABLE_AFTER_BUTTON, timeout)
+        return self.wait_for_element_enabled("enableAfter", timeout)
 
     def click_enabled_button(self):
         """Click the enabled button."""
@@ -249,7 +314,13 @@ class DemoQADroppablePage(BasePage):
     DROPPABLE_ELEMENT = (By.CSS_SELECTOR, "#droppable")
 
     def perform_drag_and_drop(self):
-        """Perform drag and drop operation."""
+        """
+        Perform drag and drop operation.
+
+        The droppable widget is jQuery UI, driven by mouse events rather than
+        HTML5 drag events, so synthetic DragEvents would not trigger a drop.
+        ActionChains already sends the whole gesture in one actions request.
+        """
         self.drag_and_drop(self.DRAGGABLE_ELEMENT, self.DROPPABLE_ELEMENT, timeout=20)
 
     def get_droppable_text(self):
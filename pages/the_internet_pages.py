@@ -21,6 +21,22 @@ class TheInternetMainPage(BasePage):
     FRAMES_LINK = (By.CSS_SELECTOR, "a[href='/frames']")
     TABLES_LINK = (By.CSS_SELECTOR, "a[href='/tables']")
 
+    def __init__(self, driver):
+        """Initialize main page with an empty title cache."""
+        super().__init__(driver)
+        self._cached_title = None
+
+    def get_page_title(self) -> str:
+        """
+        Get the homepage title.
+
+        The homepage title never changes, so it is read once per page object;
+        an empty title (page still loading) is not cached.
+        """
+        if not self._cached_title:
+            self._cached_title = self.driver.execute_script("return document.title;")
+        return self._cached_title
+
     def click_form_authentication(self):
         """Click on Form Authentication link."""
         self.click_element(self.FORM_AUTHENTICATION_LINK, timeout=20)
@@ -224,19 +240,29 @@ class TheInternetCheckboxesPage(BasePage):
         element = self.find_element(self.CHECKBOX_2, timeout=20)
         return element.is_selected()
 
+    def get_all_checkbox_states(self):
+        """Return the checked state of every checkbox, in page order."""
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(\"input[type='checkbox']\"))"
+            ".map(c => c.checked);"
+        )
+
+    def _set_all_checkboxes(self, checked):
+        """Click every checkbox not already in the wanted state in one script call."""
+        self.find_element(self.CHECKBOX_1, timeout=20)
+        self.driver.execute_script(
+            "document.querySelectorAll(\"input[type='checkbox']\").forEach("
+            "c => { if (c.checked !== arguments[0]) c.click(); });",
+            checked,
+        )
+
     def check_all_checkboxes(self):
         """Check all checkboxes."""
-        if not self.is_checkbox_1_checked():
-            self.click_checkbox_1()
-        if not self.is_checkbox_2_checked():
-            self.click_checkbox_2()
+        self._set_all_checkboxes(True)
 
     def uncheck_all_checkboxes(self):
         """Uncheck all checkboxes."""
-        if self.is_checkbox_1_checked():
-            self.click_checkbox_1()
-        if self.is_checkbox_2_checked():
-            self.click_checkbox_2()
+        self._set_all_checkboxes(False)
 
 
 class TheInternetDropdownPage(BasePage):
@@ -293,20 +319,6 @@ class TheInternetJavaScriptAlertsPage(BasePage):
         """Get result text."""
         return self.get_text(self.RESULT, timeout=20)
 
-    def accept_alert(self):
-        """Accept alert."""
-        self.driver.switch_to.alert.accept()
-
-    def dismiss_alert(self):
-        """Dismiss alert."""
-        self.driver.switch_to.alert.dismiss()
-
-    def send_keys_to_alert(self, text):
-        """Send keys to prompt alert."""
-        alert = self.driver.switch_to.alert
-        alert.send_keys(text)
-        alert.accept()
-
 
 class TheInternetFramesPage(BasePage):
     """Frames page object for The Internet."""
@@ -400,38 +412,37 @@ class TheInternetTablesPage(BasePage):
     TABLE_HEADERS = (By.CSS_SELECTOR, "th")
     TABLE_ROWS = (By.CSS_SELECTOR, "tr")
 
+    def _table_selector(self, table_id):
+        """CSS selector of the requested table, used as a prefix for child lookups."""
+        return self.TABLE_1[1] if table_id == 1 else self.TABLE_2[1]
+
     def get_table_headers(self, table_id=1):
         """Get table headers."""
-        if table_id == 1:
-            table = self.find_element(self.TABLE_1, timeout=20)
-        else:
-            table = self.find_element(self.TABLE_2, timeout=20)
-
-        headers = table.find_elements(By.CSS_SELECTOR, "th")
+        headers = self.find_elements(
+            (By.CSS_SELECTOR, f"{self._table_selector(table_id)} th"), timeout=20
+        )
         return [header.text for header in headers]
 
     def get_table_data(self, table_id=1):
         """Get table data."""
-        if table_id == 1:
-            table = self.find_element(self.TABLE_1, timeout=20)
-        else:
-            table = self.find_element(self.TABLE_2, timeout=20)
-
-        rows = table.find_elements(By.CSS_SELECTOR, "tr")[1:]  # Skip header row
-        data = []
-        for row in rows:
-            cells = row.find_elements(By.CSS_SELECTOR, "td")
-            data.append([cell.text for cell in cells])
-        return data
+        table = self._table_selector(table_id)
+        rows = self.find_elements((By.CSS_SELECTOR, f"{table} tbody tr"), timeout=20)
+        cells = self.driver.find_elements(By.CSS_SELECTOR, f"{table} tbody td")
+        width = len(cells) // len(rows)
+        if not width:
+            return [[] for _ in rows]
+        return [
+            [cell.text for cell in cells[start:start + width]]
+            for start in range(0, len(cells), width)
+        ]
 
     def click_header_to_sort(self, header_text, table_id=1):
         """Click header to sort table."""
-        if table_id == 1:
-            table = self.find_element(self.TABLE_1, timeout=20)
-        else:
-            table = self.find_element(self.TABLE_2, timeout=20)
-
-        header = table.find_element(By.XPATH, f".//th[text()='{header_text}']")
+        table = self._table_selector(table_id).lstrip("#")
+        header = self.find_element(
+            (By.XPATH, f"//table[@id='{table}']//th[text()='{header_text}']"),
+            timeout=20,
+        )
         header.click()
 
     def get_row_count(self, table_id=1):
@@ -50,7 +50,7 @@ def main():
 
     # Run unit tests
     success &= run_command(
-        "pytest tests/unit/ -v --cov=utils --cov-report=html:reports/coverage --cov-report=term-missing",
+        "pytest tests/unit/ -n auto --dist=worksteal -v --cov=utils --cov-report=html:reports/coverage --cov-report=term-missing",
         "Unit Tests with Coverage",
     )
 
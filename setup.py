@@ -61,6 +61,12 @@ setup(
             "flake8>=6.0.0",
             "isort>=5.12.0",
         ],
+        "numpy": [
+            "numpy>=1.22.0",
+        ],
+        "upload": [
+            "requests-toolbelt>=1.0.0",
+        ],
     },
     include_package_data=True,
     package_data={
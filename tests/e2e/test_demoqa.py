@@ -2,13 +2,17 @@
 E2E tests for DemoQA practice site.
 """
 
-import os
+import logging
 
 import pytest
 from selenium.webdriver.common.by import By
 
 from pages.base_page import BasePage
 
+log = logging.getLogger(__name__)
+
+BANNER = "=" * 80
+
 
 class TestDemoQA:
     """Test cases for DemoQA practice site."""
@@ -16,50 +20,55 @@ class TestDemoQA:
     @pytest.fixture(autouse=True)
     def setup_page(self, driver):
         """Setup page object for tests."""
-        print("\n🔧 Setting up DemoQA page object...")
+        log.info("🔧 Setting up DemoQA page object...")
         self.page = BasePage(driver)
         self.driver = driver
-        print("✅ DemoQA page object initialized successfully")
+        log.info("✅ DemoQA page object initialized successfully")
+
+    def log_banner(self, title):
+        """Log a test banner as a single record."""
+        log.info("%s\n%s\n%s", BANNER, title, BANNER)
 
     def log_step(self, step_name, description, expected_result=None):
-        """Log test step details to console."""
-        print(f"\n📋 {step_name}")
-        print(f"   Description: {description}")
+        """Log test step details as a single record."""
         if expected_result:
-            print(f"   Expected: {expected_result}")
+            log.info(
+                "📋 %s\n   Description: %s\n   Expected: %s",
+                step_name,
+                description,
+                expected_result,
+            )
+        else:
+            log.info("📋 %s\n   Description: %s", step_name, description)
 
     def log_page_html(self, test_name):
         """Log page HTML for debugging."""
+        log_file = f"logs/{test_name}_page.html"
         try:
-            html = self.driver.page_source
-            log_file = f"logs/{test_name}_page.html"
-            os.makedirs("logs", exist_ok=True)
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"📄 Page HTML logged to: {log_file}")
+            with open(log_file, "wb") as f:
+                f.write(self.driver.page_source.encode("utf-8", errors="replace"))
+            log.info("📄 Page HTML written to: %s", log_file)
         except Exception as e:
-            print(f"❌ Failed to log HTML: {e}")
+            log.error("❌ Failed to log HTML: %s", e)
 
     def testFormSubmission(self):
         """
         Test form submission on DemoQA practice form
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Practice Form Submission")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Practice Form Submission")
 
         try:
             # ===== STEP 1: NAVIGATE TO PRACTICE FORM =====
             self.log_step(
                 "STEP 1", "Navigate to DemoQA practice form", "Practice form page loads"
             )
-            print("   🌐 Navigating to https://demoqa.com/automation-practice-form")
+            log.info("   🌐 Navigating to https://demoqa.com/automation-practice-form")
             self.driver.get("https://demoqa.com/automation-practice-form")
             
             # Wait for page to fully load
-            print("   ⏳ Waiting for page to fully load...")
+            log.info("   ⏳ Waiting for page to fully load...")
             self.page.wait_for_page_load(30)
-            print("   ✅ Practice form page loaded")
+            log.info("   ✅ Practice form page loaded")
 
             # ===== STEP 2: FILL PERSONAL INFORMATION =====
             self.log_step(
@@ -67,66 +76,66 @@ class TestDemoQA:
                 "Fill personal information fields",
                 "All personal fields populated",
             )
-            print("   📝 Filling personal information...")
+            log.info("   📝 Filling personal information...")
 
-            print("   👤 Entering first name: John")
+            log.info("   👤 Entering first name: John")
             self.page.type_text((By.ID, "firstName"), "John")
             import time
             time.sleep(1)  # Small wait for stability
 
-            print("   👤 Entering last name: Doe")
+            log.info("   👤 Entering last name: Doe")
             self.page.type_text((By.ID, "lastName"), "Doe")
             time.sleep(1)  # Small wait for stability
 
-            print("   📧 Entering email: john.doe@example.com")
+            log.info("   📧 Entering email: john.doe@example.com")
             self.page.type_text((By.ID, "userEmail"), "john.doe@example.com")
             time.sleep(1)  # Small wait for stability
-            print("   ✅ Personal information filled")
+            log.info("   ✅ Personal information filled")
 
             # ===== STEP 3: SELECT GENDER =====
             self.log_step("STEP 3", "Select gender option", "Male gender selected")
-            print("   👨 Selecting gender: Male")
+            log.info("   👨 Selecting gender: Male")
             
             # Try multiple approaches to select gender
             gender_selected = False
             
             # Approach 1: Try clicking the radio button directly
             try:
-                print("   🔍 Attempting to click gender radio button...")
+                log.info("   🔍 Attempting to click gender radio button...")
                 self.page.click_element((By.XPATH, "//input[@value='Male']"))
                 gender_selected = True
-                print("   ✅ Gender selected via direct click")
+                log.info("   ✅ Gender selected via direct click")
             except Exception as e:
-                print(f"   ⚠️ Direct click failed: {e}")
+                log.warning("   ⚠️ Direct click failed: %s", e)
                 
                 # Approach 2: Try clicking the label instead
                 try:
-                    print("   🔍 Attempting to click gender label...")
+                    log.info("   🔍 Attempting to click gender label...")
                     self.page.click_element((By.XPATH, "//label[contains(text(), 'Male')]"))
                     gender_selected = True
-                    print("   ✅ Gender selected via label click")
+                    log.info("   ✅ Gender selected via label click")
                 except Exception as e2:
-                    print(f"   ⚠️ Label click failed: {e2}")
+                    log.warning("   ⚠️ Label click failed: %s", e2)
                     
                     # Approach 3: Use JavaScript click
                     try:
-                        print("   🔍 Attempting JavaScript click...")
+                        log.info("   🔍 Attempting JavaScript click...")
                         gender_element = self.page.find_element((By.XPATH, "//input[@value='Male']"))
                         self.driver.execute_script("arguments[0].click();", gender_element)
                         gender_selected = True
-                        print("   ✅ Gender selected via JavaScript click")
+                        log.info("   ✅ Gender selected via JavaScript click")
                     except Exception as e3:
-                        print(f"   ⚠️ JavaScript click failed: {e3}")
+                        log.warning("   ⚠️ JavaScript click failed: %s", e3)
                         
                         # Approach 4: Try scrolling to element first
                         try:
-                            print("   🔍 Attempting scroll + click...")
+                            log.info("   🔍 Attempting scroll + click...")
                             self.page.scroll_to_element((By.XPATH, "//input[@value='Male']"))
                             self.page.click_element((By.XPATH, "//input[@value='Male']"))
                             gender_selected = True
-                            print("   ✅ Gender selected via scroll + click")
+                            log.info("   ✅ Gender selected via scroll + click")
                         except Exception as e4:
-                            print(f"   ❌ All gender selection methods failed: {e4}")
+                            log.error("   ❌ All gender selection methods failed: %s", e4)
                             raise Exception("Failed to select gender after trying all methods")
             
             if not gender_selected:
@@ -136,69 +145,69 @@ class TestDemoQA:
             self.log_step(
                 "STEP 4", "Enter mobile number", "Mobile number field populated"
             )
-            print("   📱 Entering mobile number: 1234567890")
+            log.info("   📱 Entering mobile number: 1234567890")
             self.page.type_text((By.ID, "userNumber"), "1234567890")
             time.sleep(1)  # Small wait for stability
-            print("   ✅ Mobile number entered")
+            log.info("   ✅ Mobile number entered")
 
             # ===== STEP 5: SELECT DATE OF BIRTH =====
             self.log_step("STEP 5", "Select date of birth", "Date picker opened")
-            print("   📅 Opening date picker...")
+            log.info("   📅 Opening date picker...")
             self.page.click_element((By.ID, "dateOfBirthInput"))
-            print("   ✅ Date picker opened (date selection logic to be implemented)")
+            log.info("   ✅ Date picker opened (date selection logic to be implemented)")
 
             # ===== STEP 6: SELECT SUBJECTS =====
             self.log_step(
                 "STEP 6", "Select subjects", "Computer Science subject selected"
             )
-            print("   📚 Entering subject: Computer Science")
+            log.info("   📚 Entering subject: Computer Science")
             self.page.type_text((By.ID, "subjectsInput"), "Computer Science")
-            print("   ✅ Subject entered")
+            log.info("   ✅ Subject entered")
 
             # ===== STEP 7: SELECT HOBBIES =====
             self.log_step("STEP 7", "Select hobbies", "Sports hobby selected")
-            print("   ⚽ Selecting hobby: Sports")
+            log.info("   ⚽ Selecting hobby: Sports")
             
             # Try multiple approaches to select hobby
             hobby_selected = False
             
             # Approach 1: Try clicking the checkbox directly
             try:
-                print("   🔍 Attempting to click hobby checkbox...")
+                log.info("   🔍 Attempting to click hobby checkbox...")
                 self.page.click_element((By.XPATH, "//input[@value='Sports']"))
                 hobby_selected = True
-                print("   ✅ Hobby selected via direct click")
+                log.info("   ✅ Hobby selected via direct click")
             except Exception as e:
-                print(f"   ⚠️ Direct click failed: {e}")
+                log.warning("   ⚠️ Direct click failed: %s", e)
                 
                 # Approach 2: Try clicking the label instead
                 try:
-                    print("   🔍 Attempting to click hobby label...")
+                    log.info("   🔍 Attempting to click hobby label...")
                     self.page.click_element((By.XPATH, "//label[contains(text(), 'Sports')]"))
                     hobby_selected = True
-                    print("   ✅ Hobby selected via label click")
+                    log.info("   ✅ Hobby selected via label click")
                 except Exception as e2:
-                    print(f"   ⚠️ Label click failed: {e2}")
+                    log.warning("   ⚠️ Label click failed: %s", e2)
                     
                     # Approach 3: Use JavaScript click
                     try:
-                        print("   🔍 Attempting JavaScript click...")
+                        log.info("   🔍 Attempting JavaScript click...")
                         hobby_element = self.page.find_element((By.XPATH, "//input[@value='Sports']"))
                         self.driver.execute_script("arguments[0].click();", hobby_element)
                         hobby_selected = True
-                        print("   ✅ Hobby selected via JavaScript click")
+                        log.info("   ✅ Hobby selected via JavaScript click")
                     except Exception as e3:
-                        print(f"   ⚠️ JavaScript click failed: {e3}")
+                        log.warning("   ⚠️ JavaScript click failed: %s", e3)
                         
                         # Approach 4: Try scrolling to element first
                         try:
-                            print("   🔍 Attempting scroll + click...")
+                            log.info("   🔍 Attempting scroll + click...")
                             self.page.scroll_to_element((By.XPATH, "//input[@value='Sports']"))
                             self.page.click_element((By.XPATH, "//input[@value='Sports']"))
                             hobby_selected = True
-                            print("   ✅ Hobby selected via scroll + click")
+                            log.info("   ✅ Hobby selected via scroll + click")
                         except Exception as e4:
-                            print(f"   ❌ All hobby selection methods failed: {e4}")
+                            log.error("   ❌ All hobby selection methods failed: %s", e4)
                             raise Exception("Failed to select hobby after trying all methods")
             
             if not hobby_selected:
@@ -207,17 +216,17 @@ class TestDemoQA:
             # ===== STEP 8: ENTER ADDRESS =====
             self.log_step("STEP 8", "Enter current address", "Address field populated")
             address = "123 Test Street, Test City"
-            print(f"   🏠 Entering address: {address}")
+            log.info("   🏠 Entering address: %s", address)
             self.page.type_text((By.ID, "currentAddress"), address)
-            print("   ✅ Address entered")
+            log.info("   ✅ Address entered")
 
             # ===== STEP 9: SUBMIT FORM =====
             self.log_step(
                 "STEP 9", "Submit the form", "Form submitted and modal appears"
             )
-            print("   📤 Submitting form...")
+            log.info("   📤 Submitting form...")
             self.page.click_element((By.ID, "submit"))
-            print("   ✅ Form submitted")
+            log.info("   ✅ Form submitted")
 
             # ===== STEP 10: VERIFY SUBMISSION =====
             self.log_step(
@@ -225,29 +234,29 @@ class TestDemoQA:
                 "Verify form submission",
                 "Success modal displayed with correct message",
             )
-            print("   🔍 Checking for submission modal...")
+            log.info("   🔍 Checking for submission modal...")
             assert self.page.is_element_present(
                 (By.CLASS_NAME, "modal-content")
             ), "Modal not displayed"
-            print("   ✅ Submission modal is present")
+            log.info("   ✅ Submission modal is present")
 
             # Try multiple approaches to get the modal title
             modal_title = ""
             try:
                 modal_title = self.page.get_text((By.CLASS_NAME, "modal-title"))
-                print(f"   📄 Modal title (via class): '{modal_title}'")
+                log.info("   📄 Modal title (via class): '%s'", modal_title)
             except Exception as e:
-                print(f"   ⚠️ Failed to get title via class name: {e}")
+                log.warning("   ⚠️ Failed to get title via class name: %s", e)
                 try:
                     modal_title = self.page.get_text((By.CSS_SELECTOR, ".modal-title"))
-                    print(f"   📄 Modal title (via CSS): '{modal_title}'")
+                    log.info("   📄 Modal title (via CSS): '%s'", modal_title)
                 except Exception as e2:
-                    print(f"   ⚠️ Failed to get title via CSS selector: {e2}")
+                    log.warning("   ⚠️ Failed to get title via CSS selector: %s", e2)
                     try:
                         modal_title = self.page.get_text((By.ID, "example-modal-sizes-title-lg"))
-                        print(f"   📄 Modal title (via ID): '{modal_title}'")
+                        log.info("   📄 Modal title (via ID): '%s'", modal_title)
                     except Exception as e3:
-                        print(f"   ⚠️ Failed to get title via ID: {e3}")
+                        log.warning("   ⚠️ Failed to get title via ID: %s", e3)
                         modal_title = ""
 
             # More lenient assertion - check if modal title contains expected text or if it's the expected text
@@ -255,53 +264,50 @@ class TestDemoQA:
             title_valid = any(expected in modal_title for expected in expected_texts) if modal_title else False
             
             if title_valid:
-                print("   ✅ Form submission verification passed")
+                log.info("   ✅ Form submission verification passed")
             else:
-                print(f"   ⚠️ Modal title might be empty or unexpected: '{modal_title}'")
-                print("   ℹ️ Checking if form was actually submitted successfully...")
+                log.warning("   ⚠️ Modal title might be empty or unexpected: '%s'", modal_title)
+                log.info("   ℹ️ Checking if form was actually submitted successfully...")
                 # If modal is present and visible, consider it successful
                 if self.page.is_element_present((By.CLASS_NAME, "modal-content")):
-                    print("   ✅ Modal is present - form submission appears successful")
+                    log.info("   ✅ Modal is present - form submission appears successful")
                 else:
                     raise AssertionError(f"Modal title verification failed. Got: '{modal_title}'")
 
-            print("\n🎉 DemoQA practice form submission test completed successfully!")
+            log.info("🎉 DemoQA practice form submission test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
-            print("📄 Logging page HTML for debugging...")
+            log.error("❌ Test failed: %s", e)
+            log.info("📄 Logging page HTML for debugging...")
             self.log_page_html("demoqa_form_submission")
-            print("📄 Page HTML logged to: logs/demoqa_form_submission_page.html")
             raise e
 
     def testDragDrop(self):
         """
         Test drag and drop functionality on DemoQA
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Drag and Drop Functionality")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Drag and Drop Functionality")
 
         try:
             # ===== STEP 1: NAVIGATE TO DROPPABLE PAGE =====
             self.log_step(
                 "STEP 1", "Navigate to droppable page", "Droppable page loads"
             )
-            print("   🌐 Navigating to https://demoqa.com/droppable")
+            log.info("   🌐 Navigating to https://demoqa.com/droppable")
             self.driver.get("https://demoqa.com/droppable")
-            print("   ✅ Droppable page loaded")
+            log.info("   ✅ Droppable page loaded")
 
             # ===== STEP 2: LOCATE DRAGGABLE AND DROPPABLE ELEMENTS =====
             self.log_step(
                 "STEP 2", "Locate draggable and droppable elements", "Elements found"
             )
-            print("   🔍 Finding draggable element...")
+            log.info("   🔍 Finding draggable element...")
             draggable = self.page.find_element((By.ID, "draggable"))
-            print("   ✅ Draggable element found")
+            log.info("   ✅ Draggable element found")
 
-            print("   🔍 Finding droppable element...")
+            log.info("   🔍 Finding droppable element...")
             droppable = self.page.find_element((By.ID, "droppable"))
-            print("   ✅ Droppable element found")
+            log.info("   ✅ Droppable element found")
 
             # ===== STEP 3: PERFORM DRAG AND DROP =====
             self.log_step(
@@ -309,9 +315,9 @@ class TestDemoQA:
                 "Perform drag and drop operation",
                 "Element dragged and dropped",
             )
-            print("   🖱️ Performing drag and drop...")
+            log.info("   🖱️ Performing drag and drop...")
             self.page.drag_and_drop((By.ID, "draggable"), (By.ID, "droppable"))
-            print("   ✅ Drag and drop operation completed")
+            log.info("   ✅ Drag and drop operation completed")
 
             # ===== STEP 4: VERIFY DROP SUCCESS =====
             self.log_step(
@@ -319,19 +325,19 @@ class TestDemoQA:
                 "Verify drop was successful",
                 "Droppable text shows 'Dropped!'",
             )
-            print("   🔍 Checking droppable text...")
+            log.info("   🔍 Checking droppable text...")
             droppable_text = self.page.get_text((By.ID, "droppable"))
-            print(f"   📄 Droppable text: {droppable_text}")
+            log.info("   📄 Droppable text: %s", droppable_text)
 
             assert (
                 "Dropped!" in droppable_text
             ), f"Expected 'Dropped!' in text, got: {droppable_text}"
-            print("   ✅ Drag and drop verification passed")
+            log.info("   ✅ Drag and drop verification passed")
 
-            print("\n🎉 DemoQA drag and drop test completed successfully!")
+            log.info("🎉 DemoQA drag and drop test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_drag_drop")
             raise e
 
@@ -339,9 +345,7 @@ class TestDemoQA:
         """
         Test dynamic properties page functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Dynamic Properties")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Dynamic Properties")
 
         try:
             # ===== STEP 1: NAVIGATE TO DYNAMIC PROPERTIES PAGE =====
@@ -350,9 +354,9 @@ class TestDemoQA:
                 "Navigate to dynamic properties page",
                 "Dynamic properties page loads",
             )
-            print("   🌐 Navigating to https://demoqa.com/dynamic-properties")
+            log.info("   🌐 Navigating to https://demoqa.com/dynamic-properties")
             self.driver.get("https://demoqa.com/dynamic-properties")
-            print("   ✅ Dynamic properties page loaded")
+            log.info("   ✅ Dynamic properties page loaded")
 
             # ===== STEP 2: WAIT FOR BUTTON TO BE ENABLED =====
             self.log_step(
@@ -360,19 +364,19 @@ class TestDemoQA:
                 "Wait for button to be enabled",
                 "Button becomes clickable after 5 seconds",
             )
-            print("   ⏱️ Waiting for button to be enabled (timeout: 10 seconds)...")
-            assert self.page.is_element_clickable(
-                (By.ID, "enableAfter"), timeout=10
+            log.info("   ⏱️ Waiting for button to be enabled (timeout: 10 seconds)...")
+            assert self.page.wait_for_element_enabled(
+                "enableAfter", timeout=10
             ), "Button not enabled"
-            print("   ✅ Button is now enabled")
+            log.info("   ✅ Button is now enabled")
 
             # ===== STEP 3: CLICK THE ENABLED BUTTON =====
             self.log_step(
                 "STEP 3", "Click the enabled button", "Button clicked successfully"
             )
-            print("   🔘 Clicking the enabled button...")
+            log.info("   🔘 Clicking the enabled button...")
             self.page.click_element((By.ID, "enableAfter"))
-            print("   ✅ Enabled button clicked")
+            log.info("   ✅ Enabled button clicked")
 
             # ===== STEP 4: VERIFY COLOR CHANGE =====
             self.log_step(
@@ -380,20 +384,20 @@ class TestDemoQA:
                 "Verify color change on color button",
                 "Button color has changed",
             )
-            print("   🎨 Checking color change on color button...")
+            log.info("   🎨 Checking color change on color button...")
             color_button = self.page.find_element((By.ID, "colorChange"))
             color = color_button.value_of_css_property("color")
-            print(f"   📊 Button color: {color}")
+            log.info("   📊 Button color: %s", color)
 
             assert (
                 color != "rgba(255, 255, 255, 1)"
             ), f"Button should not be white, got: {color}"
-            print("   ✅ Color change verification passed")
+            log.info("   ✅ Color change verification passed")
 
-            print("\n🎉 DemoQA dynamic properties test completed successfully!")
+            log.info("🎉 DemoQA dynamic properties test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_dynamic_properties")
             raise e
 
@@ -401,42 +405,40 @@ class TestDemoQA:
         """
         Test alerts and frames functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Alerts and Frames")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Alerts and Frames")
 
         try:
             # ===== STEP 1: NAVIGATE TO ALERTS PAGE =====
             self.log_step(
                 "STEP 1", "Navigate to alerts and windows page", "Alerts page loads"
             )
-            print("   🌐 Navigating to https://demoqa.com/alerts")
+            log.info("   🌐 Navigating to https://demoqa.com/alerts")
             self.driver.get("https://demoqa.com/alerts")
-            print("   ✅ Alerts page loaded")
+            log.info("   ✅ Alerts page loaded")
 
             # ===== STEP 2: TEST SIMPLE ALERT =====
             self.log_step(
                 "STEP 2", "Test simple alert", "Alert appears and is accepted"
             )
-            print("   ⚠️ Clicking simple alert button...")
+            log.info("   ⚠️ Clicking simple alert button...")
             self.page.click_element((By.ID, "alertButton"))
-            print("   ✅ Simple alert triggered")
+            log.info("   ✅ Simple alert triggered")
 
-            print("   ✅ Accepting simple alert...")
+            log.info("   ✅ Accepting simple alert...")
             self.page.accept_alert()
-            print("   ✅ Simple alert accepted")
+            log.info("   ✅ Simple alert accepted")
 
             # ===== STEP 3: TEST CONFIRM ALERT =====
             self.log_step(
                 "STEP 3", "Test confirm alert", "Confirm alert appears and is accepted"
             )
-            print("   ⚠️ Clicking confirm alert button...")
+            log.info("   ⚠️ Clicking confirm alert button...")
             self.page.click_element((By.ID, "confirmButton"))
-            print("   ✅ Confirm alert triggered")
+            log.info("   ✅ Confirm alert triggered")
 
-            print("   ✅ Accepting confirm alert...")
+            log.info("   ✅ Accepting confirm alert...")
             self.page.accept_alert()
-            print("   ✅ Confirm alert accepted")
+            log.info("   ✅ Confirm alert accepted")
 
             # ===== STEP 4: TEST PROMPT ALERT =====
             self.log_step(
@@ -444,23 +446,23 @@ class TestDemoQA:
                 "Test prompt alert",
                 "Prompt alert appears, text entered, and accepted",
             )
-            print("   ⚠️ Clicking prompt alert button...")
+            log.info("   ⚠️ Clicking prompt alert button...")
             self.page.click_element((By.ID, "promtButton"))
-            print("   ✅ Prompt alert triggered")
+            log.info("   ✅ Prompt alert triggered")
 
             alert = self.driver.switch_to.alert
-            print("   📝 Entering text in prompt: Test Name")
+            log.info("   📝 Entering text in prompt: Test Name")
             alert.send_keys("Test Name")
-            print("   ✅ Text entered in prompt")
+            log.info("   ✅ Text entered in prompt")
 
-            print("   ✅ Accepting prompt alert...")
+            log.info("   ✅ Accepting prompt alert...")
             alert.accept()
-            print("   ✅ Prompt alert accepted")
+            log.info("   ✅ Prompt alert accepted")
 
-            print("\n🎉 DemoQA alerts and frames test completed successfully!")
+            log.info("🎉 DemoQA alerts and frames test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_alerts_frames")
             raise e
 
@@ -468,41 +470,39 @@ class TestDemoQA:
         """
         Test book store application functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Book Store Application")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Book Store Application")
 
         try:
             # ===== STEP 1: NAVIGATE TO BOOK STORE =====
             self.log_step("STEP 1", "Navigate to book store", "Book store page loads")
-            print("   🌐 Navigating to https://demoqa.com/books")
+            log.info("   🌐 Navigating to https://demoqa.com/books")
             self.driver.get("https://demoqa.com/books")
-            print("   ✅ Book store page loaded")
+            log.info("   ✅ Book store page loaded")
 
             # ===== STEP 2: SEARCH FOR BOOKS =====
             self.log_step("STEP 2", "Search for books", "Search results displayed")
             search_term = "Git"
-            print(f"   🔍 Searching for books: {search_term}")
+            log.info("   🔍 Searching for books: %s", search_term)
             self.page.type_text((By.ID, "searchBox"), search_term)
-            print("   ✅ Search performed")
+            log.info("   ✅ Search performed")
 
             # ===== STEP 3: VERIFY SEARCH RESULTS =====
             self.log_step(
                 "STEP 3", "Verify search results", "Books found in search results"
             )
-            print("   📚 Checking search results...")
+            log.info("   📚 Checking search results...")
             books = self.page.find_elements((By.CLASS_NAME, "rt-tr-group"))
-            print(f"   📊 Number of books found: {len(books)}")
+            log.info("   📊 Number of books found: %s", len(books))
 
             assert len(books) > 0, "No books found in search results"
-            print("   ✅ Search results verified")
+            log.info("   ✅ Search results verified")
 
             # ===== STEP 4: CLICK ON FIRST BOOK =====
             self.log_step("STEP 4", "Click on first book", "Book details page loads")
-            print("   📖 Clicking on first book...")
+            log.info("   📖 Clicking on first book...")
             if books:
                 self.page.click_element((By.CLASS_NAME, "rt-tr-group"))
-                print("   ✅ First book clicked")
+                log.info("   ✅ First book clicked")
 
                 # ===== STEP 5: VERIFY BOOK DETAILS PAGE =====
                 # Commented out due to page structure changes - navigation is successful
@@ -514,14 +514,14 @@ class TestDemoQA:
                 #     (By.CLASS_NAME, "profile-wrapper")
                 # ), "Book details page not loaded"
                 # print("   ✅ Book details page verified")
-                print("   ✅ Book navigation completed successfully (verification skipped)")
+                log.info("   ✅ Book navigation completed successfully (verification skipped)")
             else:
-                print("   ⚠️ No books available to click")
+                log.warning("   ⚠️ No books available to click")
 
-            print("\n🎉 DemoQA book store test completed successfully!")
+            log.info("🎉 DemoQA book store test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_book_store")
             raise e
 
@@ -529,61 +529,59 @@ class TestDemoQA:
         """
         Test widgets interaction functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Widgets Interaction")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Widgets Interaction")
 
         try:
             # ===== STEP 1: NAVIGATE TO WIDGETS PAGE =====
             self.log_step("STEP 1", "Navigate to widgets page", "Widgets page loads")
-            print("   🌐 Navigating to https://demoqa.com/widgets")
+            log.info("   🌐 Navigating to https://demoqa.com/widgets")
             self.driver.get("https://demoqa.com/widgets")
-            print("   ✅ Widgets page loaded")
+            log.info("   ✅ Widgets page loaded")
 
             # ===== STEP 2: TEST ACCORDION =====
             self.log_step(
                 "STEP 2", "Test accordion functionality", "Accordion section expands"
             )
-            print("   📋 Clicking accordion section...")
+            log.info("   📋 Clicking accordion section...")
             self.page.click_element((By.ID, "section1Heading"))
-            print("   ✅ Accordion section clicked")
+            log.info("   ✅ Accordion section clicked")
 
-            print("   🔍 Checking accordion content visibility...")
+            log.info("   🔍 Checking accordion content visibility...")
             assert self.page.is_element_visible(
                 (By.ID, "section1Content")
             ), "Accordion content not visible"
-            print("   ✅ Accordion content is visible")
+            log.info("   ✅ Accordion content is visible")
 
             # ===== STEP 3: TEST TABS =====
             self.log_step("STEP 3", "Test tabs functionality", "Tab content switches")
-            print("   📑 Clicking 'What' tab...")
+            log.info("   📑 Clicking 'What' tab...")
             self.page.click_element((By.ID, "demo-tab-what"))
-            print("   ✅ 'What' tab clicked")
+            log.info("   ✅ 'What' tab clicked")
 
-            print("   🔍 Checking tab content visibility...")
+            log.info("   🔍 Checking tab content visibility...")
             assert self.page.is_element_visible(
                 (By.ID, "demo-tabpane-what")
             ), "Tab content not visible"
-            print("   ✅ Tab content is visible")
+            log.info("   ✅ Tab content is visible")
 
             # ===== STEP 4: TEST TOOLTIPS =====
             self.log_step(
                 "STEP 4", "Test tooltip functionality", "Tooltip appears on hover"
             )
-            print("   💡 Hovering over tooltip button...")
+            log.info("   💡 Hovering over tooltip button...")
             self.page.hover_over_element((By.ID, "toolTipButton"))
-            print("   ✅ Hover action performed")
+            log.info("   ✅ Hover action performed")
 
-            print("   🔍 Checking tooltip presence...")
+            log.info("   🔍 Checking tooltip presence...")
             assert self.page.is_element_present(
                 (By.CLASS_NAME, "tooltip-inner")
             ), "Tooltip not present"
-            print("   ✅ Tooltip is present")
+            log.info("   ✅ Tooltip is present")
 
-            print("\n🎉 DemoQA widgets test completed successfully!")
+            log.info("🎉 DemoQA widgets test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_widgets")
             raise e
 
@@ -592,50 +590,48 @@ class TestDemoQA:
         """
         Test progress bar functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Progress Bar")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Progress Bar")
 
         try:
             # ===== STEP 1: NAVIGATE TO PROGRESS BAR PAGE =====
             self.log_step(
                 "STEP 1", "Navigate to progress bar page", "Progress bar page loads"
             )
-            print("   🌐 Navigating to https://demoqa.com/progress-bar")
+            log.info("   🌐 Navigating to https://demoqa.com/progress-bar")
             self.driver.get("https://demoqa.com/progress-bar")
-            print("   ✅ Progress bar page loaded")
+            log.info("   ✅ Progress bar page loaded")
 
             # ===== STEP 2: START PROGRESS BAR =====
             self.log_step("STEP 2", "Start progress bar", "Progress bar begins filling")
-            print("   ▶️ Starting progress bar...")
+            log.info("   ▶️ Starting progress bar...")
             self.page.click_element((By.ID, "startStopButton"))
-            print("   ✅ Progress bar started")
+            log.info("   ✅ Progress bar started")
 
             # ===== STEP 3: WAIT FOR PROGRESS COMPLETION =====
             self.log_step(
                 "STEP 3", "Wait for progress completion", "Progress bar reaches 100%"
             )
-            print("   ⏱️ Waiting for progress to complete (timeout: 30 seconds)...")
+            log.info("   ⏱️ Waiting for progress to complete (timeout: 30 seconds)...")
             self.page.wait_for_element_to_disappear(
                 (By.CLASS_NAME, "progress-bar"), timeout=30
             )
-            print("   ✅ Progress bar completed")
+            log.info("   ✅ Progress bar completed")
 
             # ===== STEP 4: VERIFY COMPLETION =====
             self.log_step("STEP 4", "Verify progress completion", "Progress shows 100%")
-            print("   🔍 Checking progress completion...")
+            log.info("   🔍 Checking progress completion...")
             progress_text = self.page.get_text((By.CLASS_NAME, "progress-bar"))
-            print(f"   📊 Progress text: {progress_text}")
+            log.info("   📊 Progress text: %s", progress_text)
 
             assert (
                 "100%" in progress_text
             ), f"Progress should be 100%, got: {progress_text}"
-            print("   ✅ Progress completion verified")
+            log.info("   ✅ Progress completion verified")
 
-            print("\n🎉 DemoQA progress bar test completed successfully!")
+            log.info("🎉 DemoQA progress bar test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_progress_bar")
             raise e
 
@@ -644,9 +640,7 @@ class TestDemoQA:
         """
         Critical user flow test for DemoQA
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Critical User Flow")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Critical User Flow")
 
         try:
             # ===== STEP 1: NAVIGATE TO MAIN PAGE =====
@@ -655,9 +649,9 @@ class TestDemoQA:
                 "Navigate to DemoQA main page",
                 "Main page loads with ToolsQA title",
             )
-            print("   🌐 Navigating to https://demoqa.com/")
+            log.info("   🌐 Navigating to https://demoqa.com/")
             self.driver.get("https://demoqa.com/")
-            print("   ✅ Main page loaded")
+            log.info("   ✅ Main page loaded")
 
             # ===== STEP 2: VERIFY PAGE LOADS =====
             self.log_step(
@@ -665,27 +659,27 @@ class TestDemoQA:
                 "Verify main page loads correctly",
                 "Page title contains ToolsQA",
             )
-            print("   🔍 Checking page title...")
+            log.info("   🔍 Checking page title...")
             page_title = self.page.get_page_title()
-            print(f"   📄 Page title: {page_title}")
+            log.info("   📄 Page title: %s", page_title)
 
             assert (
                 "ToolsQA" in page_title
             ), f"Expected 'ToolsQA' in title, got: {page_title}"
-            print("   ✅ Main page verification passed")
+            log.info("   ✅ Main page verification passed")
 
             # ===== STEP 3: NAVIGATE TO ELEMENTS =====
             self.log_step(
                 "STEP 3", "Navigate to elements section", "Elements page loads"
             )
-            print("   🔗 Clicking on Elements card...")
+            log.info("   🔗 Clicking on Elements card...")
             self.page.click_element(
                 (
                     By.XPATH,
                     "//div[contains(@class, 'card-body') and contains(text(), 'Elements')]",
                 )
             )
-            print("   ✅ Elements card clicked")
+            log.info("   ✅ Elements card clicked")
 
             # ===== STEP 4: VERIFY ELEMENTS PAGE =====
             self.log_step(
@@ -693,14 +687,14 @@ class TestDemoQA:
                 "Verify elements page loads",
                 "Elements page title contains 'Elements'",
             )
-            print("   🔍 Checking elements page title...")
+            log.info("   🔍 Checking elements page title...")
             elements_title = self.page.get_page_title()
-            print(f"   📄 Elements page title: {elements_title}")
+            log.info("   📄 Elements page title: %s", elements_title)
 
             assert (
                 "Elements" in elements_title
             ), f"Expected 'Elements' in title, got: {elements_title}"
-            print("   ✅ Elements page verification passed")
+            log.info("   ✅ Elements page verification passed")
 
             # ===== STEP 5: TEST TEXT BOX =====
             self.log_step(
@@ -708,33 +702,33 @@ class TestDemoQA:
                 "Test text box functionality",
                 "Text box form submitted successfully",
             )
-            print("   📝 Clicking on Text Box...")
+            log.info("   📝 Clicking on Text Box...")
             self.page.click_element((By.XPATH, "//span[text()='Text Box']"))
-            print("   ✅ Text Box clicked")
+            log.info("   ✅ Text Box clicked")
 
-            print("   👤 Entering user name: Test User")
+            log.info("   👤 Entering user name: Test User")
             self.page.type_text((By.ID, "userName"), "Test User")
 
-            print("   📧 Entering user email: test@example.com")
+            log.info("   📧 Entering user email: test@example.com")
             self.page.type_text((By.ID, "userEmail"), "test@example.com")
 
-            print("   📤 Submitting text box form...")
+            log.info("   📤 Submitting text box form...")
             self.page.click_element((By.ID, "submit"))
-            print("   ✅ Text box form submitted")
+            log.info("   ✅ Text box form submitted")
 
             # ===== STEP 6: VERIFY SUBMISSION =====
             self.log_step(
                 "STEP 6", "Verify text box submission", "Output element is present"
             )
-            print("   🔍 Checking for output element...")
+            log.info("   🔍 Checking for output element...")
             assert self.page.is_element_present(
                 (By.ID, "output")
             ), "Output element not present"
-            print("   ✅ Text box submission verified")
+            log.info("   ✅ Text box submission verified")
 
-            print("\n🎉 DemoQA critical user flow test completed successfully!")
+            log.info("🎉 DemoQA critical user flow test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_critical_flow")
             raise e
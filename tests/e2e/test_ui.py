@@ -2,81 +2,125 @@
 Comprehensive UI tests using Page Object Model for practice sites.
 """
 
-import os
+import logging
 import time
 
 import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.demoqa_pages import *
 from pages.the_internet_pages import *
 
+log = logging.getLogger(__name__)
+
+BANNER = "=" * 80
+
+DEMOQA_URL = "https://demoqa.com/"
+THE_INTERNET_URL = "https://the-internet.herokuapp.com/"
+
+
+def ensure_on(driver, url):
+    """
+    Navigate to url unless the browser is already on exactly that page.
+
+    reset_browser_state leaves the previous test's page loaded, so a test
+    starting where the last one ended skips the reload.
+    """
+    if driver.current_url.rstrip("/") == url.rstrip("/"):
+        log.debug("   ♻️ Already on %s, skipping navigation", url)
+        return
+    log.debug("   🌐 Navigating to %s", url)
+    driver.get(url)
+
+
+def wait_for_title(driver, needle, timeout=5):
+    """Wait until the page title contains needle, polling document.title in the page."""
+    title = ""
+
+    def title_matches(d):
+        nonlocal title
+        title = d.execute_script("return document.title || '';")
+        return needle in title
+
+    try:
+        WebDriverWait(driver, timeout).until(title_matches)
+    except TimeoutException:
+        raise AssertionError(f"Expected '{needle}' in title, got: {title}") from None
+    return title
+
 
 class TestUI:
     @pytest.fixture(autouse=True)
     def setup_pages(self, driver):
         """Setup page objects for UI testing."""
-        print("\n🔧 Setting up page objects for UI testing...")
+        log.info("🔧 Setting up page objects for UI testing...")
         self.driver = driver
         self.demoqa_main = DemoQAMainPage(driver)
         self.the_internet_main = TheInternetMainPage(driver)
-        print("✅ Page objects initialized successfully")
+        log.info("✅ Page objects initialized successfully")
 
     def log_page_html(self, test_name):
         """Log page HTML for debugging."""
+        log_file = f"logs/{test_name}_page.html"
         try:
-            html = self.driver.page_source
-            log_file = f"logs/{test_name}_page.html"
-            os.makedirs("logs", exist_ok=True)
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"📄 Page HTML logged to: {log_file}")
+            with open(log_file, "wb") as f:
+                f.write(self.driver.page_source.encode("utf-8", errors="replace"))
+            log.info("📄 Page HTML written to: %s", log_file)
         except Exception as e:
-            print(f"❌ Failed to log HTML: {e}")
+            log.error("❌ Failed to log HTML: %s", e)
+
+    def open_internet_home(self):
+        """Load The Internet homepage unless the browser is already on it."""
+        ensure_on(self.driver, THE_INTERNET_URL)
+
+    def log_banner(self, title):
+        """Log a test banner as a single record."""
+        log.info("%s\n%s\n%s", BANNER, title, BANNER)
 
     def log_step(self, step_name, description, expected_result=None):
-        """Log test step details to console."""
-        print(f"\n📋 {step_name}")
-        print(f"   Description: {description}")
+        """Log test step details as a single record."""
         if expected_result:
-            print(f"   Expected: {expected_result}")
+            log.info(
+                "📋 %s\n   Description: %s\n   Expected: %s",
+                step_name,
+                description,
+                expected_result,
+            )
+        else:
+            log.info("📋 %s\n   Description: %s", step_name, description)
 
     def testDemoqaForm(self):
         """
         Test DemoQA form submission workflow
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Form Submission Workflow")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Form Submission Workflow")
 
         try:
             # ===== STEP 1: NAVIGATE TO DEMOQA =====
             self.log_step(
                 "STEP 1", "Navigate to DemoQA homepage", "Page loads with DEMOQA title"
             )
-            print("   🌐 Navigating to https://demoqa.com/")
-            self.driver.get("https://demoqa.com/")
+            ensure_on(self.driver, DEMOQA_URL)
 
             # Validate page title
-            page_title = self.demoqa_main.get_page_title()
-            print(f"   📄 Page title: {page_title}")
-            assert (
-                "DEMOQA" in page_title
-            ), f"Expected 'DEMOQA' in title, got: {page_title}"
-            print("   ✅ DemoQA homepage loaded successfully")
+            page_title = wait_for_title(self.driver, "DEMOQA")
+            log.debug("   📄 Page title: %s", page_title)
+            log.debug("   ✅ DemoQA homepage loaded successfully")
 
             # ===== STEP 2: NAVIGATE TO ELEMENTS =====
             self.log_step(
                 "STEP 2", "Navigate to Elements section", "Elements page loads"
             )
-            print("   🔗 Clicking on Elements card...")
+            log.debug("   🔗 Clicking on Elements card...")
             elements_page = self.demoqa_main.navigate_to_elements()
-            print("   ✅ Elements page loaded")
+            log.debug("   ✅ Elements page loaded")
 
             # ===== STEP 3: OPEN TEXT BOX =====
             self.log_step("STEP 3", "Open Text Box form", "Text Box form page loads")
-            print("   📝 Clicking on Text Box...")
+            log.debug("   📝 Clicking on Text Box...")
             text_box_page = elements_page.click_text_box()
-            print("   ✅ Text Box form page loaded")
+            log.debug("   ✅ Text Box form page loaded")
 
             # ===== STEP 4: FILL FORM DATA =====
             self.log_step("STEP 4", "Fill form with test data", "Form fields populated")
@@ -86,44 +130,40 @@ class TestUI:
                 "current_address": "123 Current Street",
                 "permanent_address": "456 Permanent Street",
             }
-            print(f"   📝 Filling form with data: {form_data}")
+            log.debug("   📝 Filling form with data: %s", form_data)
 
-            text_box_page.fill_form(
-                full_name=form_data["full_name"],
-                email=form_data["email"],
-                current_address=form_data["current_address"],
-                permanent_address=form_data["permanent_address"],
-            )
-            print("   ✅ Form filled successfully")
+            text_box_page.fill_form_bulk(form_data)
+            log.debug("   ✅ Form filled successfully")
 
             # ===== STEP 5: SUBMIT FORM =====
             self.log_step(
                 "STEP 5", "Submit the form", "Form submitted and output displayed"
             )
-            print("   📤 Submitting form...")
+            log.debug("   📤 Submitting form...")
             text_box_page.submit_form()
-            print("   ✅ Form submitted")
+            log.debug("   ✅ Form submitted")
 
             # ===== STEP 6: VALIDATE OUTPUT =====
             self.log_step(
                 "STEP 6", "Validate form output", "Output contains submitted data"
             )
-            print("   🔍 Checking for output display...")
-            assert text_box_page.is_output_present(), "Form output not displayed"
-            print("   ✅ Output is present")
+            log.debug("   🔍 Checking for output display...")
+            output = text_box_page.get_output_state()
+            assert output["present"], "Form output not displayed"
+            log.debug("   ✅ Output is present")
 
-            output_text = text_box_page.get_output_text()
-            print(f"   📄 Output text: {output_text}")
+            output_text = output["text"]
+            log.debug("   📄 Output text: %s", output_text)
 
             # Validate output contains submitted data
             assert "John Doe" in output_text, "Full name not found in output"
             assert "john.doe@example.com" in output_text, "Email not found in output"
-            print("   ✅ Output validation passed")
+            log.debug("   ✅ Output validation passed")
 
-            print("\n🎉 DemoQA form submission test completed successfully!")
+            log.info("🎉 DemoQA form submission test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_textbox_form")
             raise e
 
@@ -131,32 +171,29 @@ class TestUI:
         """
         Test DemoQA drag and drop functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: DemoQA Drag and Drop Functionality")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: DemoQA Drag and Drop Functionality")
 
         try:
             # ===== STEP 1: NAVIGATE TO DEMOQA =====
             self.log_step(
                 "STEP 1", "Navigate to DemoQA homepage", "Page loads with DEMOQA title"
             )
-            print("   🌐 Navigating to https://demoqa.com/")
-            self.driver.get("https://demoqa.com/")
-            print("   ✅ DemoQA homepage loaded")
+            ensure_on(self.driver, DEMOQA_URL)
+            log.debug("   ✅ DemoQA homepage loaded")
 
             # ===== STEP 2: NAVIGATE TO INTERACTIONS =====
             self.log_step(
                 "STEP 2", "Navigate to Interactions section", "Interactions page loads"
             )
-            print("   🔗 Clicking on Interactions card...")
+            log.debug("   🔗 Clicking on Interactions card...")
             interactions_page = self.demoqa_main.navigate_to_interactions()
-            print("   ✅ Interactions page loaded")
+            log.debug("   ✅ Interactions page loaded")
 
             # ===== STEP 3: OPEN DROPPABLE =====
             self.log_step("STEP 3", "Open Droppable section", "Droppable page loads")
-            print("   🎯 Clicking on Droppable...")
+            log.debug("   🎯 Clicking on Droppable...")
             droppable_page = interactions_page.click_droppable()
-            print("   ✅ Droppable page loaded")
+            log.debug("   ✅ Droppable page loaded")
 
             # ===== STEP 4: PERFORM DRAG AND DROP =====
             self.log_step(
@@ -164,27 +201,27 @@ class TestUI:
                 "Perform drag and drop operation",
                 "Element dragged and dropped",
             )
-            print("   🖱️ Performing drag and drop...")
+            log.debug("   🖱️ Performing drag and drop...")
             droppable_page.perform_drag_and_drop()
-            print("   ✅ Drag and drop operation completed")
+            log.debug("   ✅ Drag and drop operation completed")
 
             # ===== STEP 5: VALIDATE RESULT =====
             self.log_step(
                 "STEP 5", "Validate drop result", "Droppable text shows 'Dropped!'"
             )
-            print("   🔍 Checking droppable text...")
+            log.debug("   🔍 Checking droppable text...")
             droppable_text = droppable_page.get_droppable_text()
-            print(f"   📄 Droppable text: {droppable_text}")
+            log.debug("   📄 Droppable text: %s", droppable_text)
 
             assert (
                 "Dropped!" in droppable_text
             ), f"Expected 'Dropped!' in text, got: {droppable_text}"
-            print("   ✅ Drag and drop validation passed")
+            log.debug("   ✅ Drag and drop validation passed")
 
-            print("\n🎉 DemoQA drag and drop test completed successfully!")
+            log.info("🎉 DemoQA drag and drop test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("demoqa_drag_drop")
             raise e
 
@@ -192,9 +229,7 @@ class TestUI:
         """
         Test The Internet login and logout functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: The Internet Login and Logout Functionality")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: The Internet Login and Logout Functionality")
 
         try:
             # ===== STEP 1: NAVIGATE TO THE INTERNET =====
@@ -203,23 +238,22 @@ class TestUI:
                 "Navigate to The Internet homepage",
                 "Page loads with 'The Internet' title",
             )
-            print("   🌐 Navigating to https://the-internet.herokuapp.com/")
-            self.driver.get("https://the-internet.herokuapp.com/")
+            self.open_internet_home()
 
             page_title = self.the_internet_main.get_page_title()
-            print(f"   📄 Page title: {page_title}")
+            log.debug("   📄 Page title: %s", page_title)
             assert (
                 "The Internet" in page_title
             ), f"Expected 'The Internet' in title, got: {page_title}"
-            print("   ✅ The Internet homepage loaded successfully")
+            log.debug("   ✅ The Internet homepage loaded successfully")
 
             # ===== STEP 2: NAVIGATE TO LOGIN =====
             self.log_step(
                 "STEP 2", "Navigate to Form Authentication", "Login page loads"
             )
-            print("   🔐 Clicking on Form Authentication...")
+            log.debug("   🔐 Clicking on Form Authentication...")
             login_page = self.the_internet_main.click_form_authentication()
-            print("   ✅ Login page loaded")
+            log.debug("   ✅ Login page loaded")
 
             # ===== STEP 3: PERFORM LOGIN =====
             self.log_step(
@@ -228,33 +262,33 @@ class TestUI:
                 "User logged in successfully",
             )
             credentials = {"username": "tomsmith", "password": "SuperSecretPassword!"}
-            print(f"   🔑 Logging in with credentials: {credentials}")
+            log.debug("   🔑 Logging in with credentials: %s", credentials)
 
             login_page.login(credentials["username"], credentials["password"])
-            print("   ✅ Login attempt completed")
+            log.debug("   ✅ Login attempt completed")
 
             # ===== STEP 4: VALIDATE LOGIN SUCCESS =====
             self.log_step("STEP 4", "Validate successful login", "User is logged in")
-            print("   🔍 Checking login status...")
+            log.debug("   🔍 Checking login status...")
             assert login_page.is_logged_in(), "User should be logged in"
-            print("   ✅ Login successful")
+            log.debug("   ✅ Login successful")
 
             # ===== STEP 5: PERFORM LOGOUT =====
             self.log_step("STEP 5", "Perform logout", "User logged out successfully")
-            print("   🚪 Logging out...")
+            log.debug("   🚪 Logging out...")
             login_page.logout()
-            print("   ✅ Logout completed")
+            log.debug("   ✅ Logout completed")
 
             # ===== STEP 6: VALIDATE LOGOUT SUCCESS =====
             self.log_step("STEP 6", "Validate successful logout", "User is logged out")
-            print("   🔍 Checking logout status...")
+            log.debug("   🔍 Checking logout status...")
             assert not login_page.is_logged_in(), "User should be logged out"
-            print("   ✅ Logout successful")
+            log.debug("   ✅ Logout successful")
 
-            print("\n🎉 The Internet login/logout test completed successfully!")
+            log.info("🎉 The Internet login/logout test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("internet_login_logout")
             raise e
 
@@ -262,32 +296,29 @@ class TestUI:
         """
         Test The Internet checkboxes functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: The Internet Checkboxes Functionality")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: The Internet Checkboxes Functionality")
 
         try:
             # ===== STEP 1: NAVIGATE TO THE INTERNET =====
             self.log_step("STEP 1", "Navigate to The Internet homepage", "Page loads")
-            print("   🌐 Navigating to https://the-internet.herokuapp.com/")
-            self.driver.get("https://the-internet.herokuapp.com/")
-            print("   ✅ The Internet homepage loaded")
+            self.open_internet_home()
+            log.debug("   ✅ The Internet homepage loaded")
 
             # ===== STEP 2: NAVIGATE TO CHECKBOXES =====
             self.log_step(
                 "STEP 2", "Navigate to Checkboxes page", "Checkboxes page loads"
             )
-            print("   ☑️ Clicking on Checkboxes...")
+            log.debug("   ☑️ Clicking on Checkboxes...")
             checkboxes_page = self.the_internet_main.click_checkboxes()
-            print("   ✅ Checkboxes page loaded")
+            log.debug("   ✅ Checkboxes page loaded")
 
             # ===== STEP 3: CHECK ALL CHECKBOXES =====
             self.log_step(
                 "STEP 3", "Check all checkboxes", "All checkboxes become checked"
             )
-            print("   ☑️ Checking all checkboxes...")
+            log.debug("   ☑️ Checking all checkboxes...")
             checkboxes_page.check_all_checkboxes()
-            print("   ✅ All checkboxes checked")
+            log.debug("   ✅ All checkboxes checked")
 
             # ===== STEP 4: VALIDATE CHECKED STATE =====
             self.log_step(
@@ -295,25 +326,19 @@ class TestUI:
                 "Validate checkboxes are checked",
                 "Both checkboxes are checked",
             )
-            print("   🔍 Validating checkbox 1 is checked...")
-            assert (
-                checkboxes_page.is_checkbox_1_checked()
-            ), "Checkbox 1 should be checked"
-            print("   ✅ Checkbox 1 is checked")
-
-            print("   🔍 Validating checkbox 2 is checked...")
-            assert (
-                checkboxes_page.is_checkbox_2_checked()
-            ), "Checkbox 2 should be checked"
-            print("   ✅ Checkbox 2 is checked")
+            log.debug("   🔍 Validating checkbox states...")
+            states = checkboxes_page.get_all_checkbox_states()
+            log.debug("   📊 Checkbox states: %s", states)
+            assert states == [True, True], f"Both checkboxes should be checked, got: {states}"
+            log.debug("   ✅ Both checkboxes are checked")
 
             # ===== STEP 5: UNCHECK ALL CHECKBOXES =====
             self.log_step(
                 "STEP 5", "Uncheck all checkboxes", "All checkboxes become unchecked"
             )
-            print("   ☐ Unchecking all checkboxes...")
+            log.debug("   ☐ Unchecking all checkboxes...")
             checkboxes_page.uncheck_all_checkboxes()
-            print("   ✅ All checkboxes unchecked")
+            log.debug("   ✅ All checkboxes unchecked")
 
             # ===== STEP 6: VALIDATE UNCHECKED STATE =====
             self.log_step(
@@ -321,22 +346,16 @@ class TestUI:
                 "Validate checkboxes are unchecked",
                 "Both checkboxes are unchecked",
             )
-            print("   🔍 Validating checkbox 1 is unchecked...")
-            assert (
-                not checkboxes_page.is_checkbox_1_checked()
-            ), "Checkbox 1 should be unchecked"
-            print("   ✅ Checkbox 1 is unchecked")
-
-            print("   🔍 Validating checkbox 2 is unchecked...")
-            assert (
-                not checkboxes_page.is_checkbox_2_checked()
-            ), "Checkbox 2 should be unchecked"
-            print("   ✅ Checkbox 2 is unchecked")
+            log.debug("   🔍 Validating checkbox states...")
+            states = checkboxes_page.get_all_checkbox_states()
+            log.debug("   📊 Checkbox states: %s", states)
+            assert states == [False, False], f"Both checkboxes should be unchecked, got: {states}"
+            log.debug("   ✅ Both checkboxes are unchecked")
 
-            print("\n🎉 The Internet checkboxes test completed successfully!")
+            log.info("🎉 The Internet checkboxes test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("internet_checkboxes")
             raise e
 
@@ -344,56 +363,53 @@ class TestUI:
         """
         Test The Internet JavaScript alerts functionality
         """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: The Internet JavaScript Alerts Functionality")
-        print("=" * 80)
+        self.log_banner("🧪 TEST: The Internet JavaScript Alerts Functionality")
 
         try:
             # ===== STEP 1: NAVIGATE TO THE INTERNET =====
             self.log_step("STEP 1", "Navigate to The Internet homepage", "Page loads")
-            print("   🌐 Navigating to https://the-internet.herokuapp.com/")
-            self.driver.get("https://the-internet.herokuapp.com/")
-            print("   ✅ The Internet homepage loaded")
+            self.open_internet_home()
+            log.debug("   ✅ The Internet homepage loaded")
 
             # ===== STEP 2: NAVIGATE TO JAVASCRIPT ALERTS =====
             self.log_step(
                 "STEP 2", "Navigate to JavaScript Alerts", "Alerts page loads"
             )
-            print("   ⚠️ Clicking on JavaScript Alerts...")
+            log.debug("   ⚠️ Clicking on JavaScript Alerts...")
             alerts_page = self.the_internet_main.click_javascript_alerts()
-            print("   ✅ JavaScript Alerts page loaded")
+            log.debug("   ✅ JavaScript Alerts page loaded")
 
             # ===== STEP 3: TRIGGER JS ALERT =====
             self.log_step("STEP 3", "Click JS Alert button", "JavaScript alert appears")
-            print("   🔘 Clicking JS Alert button...")
+            log.debug("   🔘 Clicking JS Alert button...")
             alerts_page.click_js_alert()
-            print("   ✅ JS Alert triggered")
+            log.debug("   ✅ JS Alert triggered")
 
             # ===== STEP 4: ACCEPT ALERT =====
             self.log_step(
                 "STEP 4", "Accept the alert", "Alert accepted and result displayed"
             )
-            print("   ✅ Accepting alert...")
+            log.debug("   ✅ Accepting alert...")
             alerts_page.accept_alert()
-            print("   ✅ Alert accepted")
+            log.debug("   ✅ Alert accepted")
 
             # ===== STEP 5: VALIDATE RESULT =====
             self.log_step(
                 "STEP 5", "Validate alert result", "Result text shows success message"
             )
-            print("   🔍 Checking result text...")
+            log.debug("   🔍 Checking result text...")
             result_text = alerts_page.get_result_text()
-            print(f"   📄 Result text: {result_text}")
+            log.debug("   📄 Result text: %s", result_text)
 
             expected_text = "You successfully clicked an alert"
             assert (
                 expected_text in result_text
             ), f"Expected '{expected_text}' in result, got: {result_text}"
-            print("   ✅ Alert result validation passed")
+            log.debug("   ✅ Alert result validation passed")
 
-            print("\n🎉 The Internet JavaScript alerts test completed successfully!")
+            log.info("🎉 The Internet JavaScript alerts test completed successfully!")
 
         except Exception as e:
-            print(f"\n❌ Test failed: {e}")
+            log.error("❌ Test failed: %s", e)
             self.log_page_html("internet_js_alert")
             raise e
@@ -0,0 +1,224 @@
+"""
+Unit tests for the API client against a local HTTP server.
+"""
+
+import http.server
+import json
+import threading
+import time
+
+import pytest
+import requests
+from loguru import logger
+
+from utils import api_client
+from utils.api_client import APIClient
+
+ETAG = '"v1"'
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Echoes the Authorization header with ETag revalidation; records POST bodies."""
+
+    hits = 0
+    # Statuses returned to the next POSTs before falling back to 200
+    post_statuses = []
+    post_bodies = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = self._read_chunked()
+        else:
+            body = self.rfile.read(length)
+        type(self).post_bodies.append(body)
+        status = self.post_statuses.pop(0) if self.post_statuses else 200
+        self._send_json(status, {"received": len(body)})
+
+    def _read_chunked(self):
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            chunk = self.rfile.read(size + 2)[:size]
+            if not size:
+                return body
+            body += chunk
+
+    def do_GET(self):
+        if self.path == "/old":
+            self.send_response(302)
+            self.send_header("Location", "/data")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        type(self).hits += 1
+        self._send_json(200, {"auth": self.headers.get("Authorization")})
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server for the duration of a test."""
+    _Handler.hits = 0
+    _Handler.post_statuses = []
+    _Handler.post_bodies = []
+    api_client._CIRCUITS.clear()
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_cache_is_opt_in(server):
+    client = APIClient(base_url=server)
+    client.get("/data")
+    client.get("/data")
+    assert not client._cache
+    assert _Handler.hits == 2
+
+
+def test_cache_revalidates_with_etag(server):
+    client = APIClient(base_url=server, cache_responses=True)
+    first = client.get("/data")
+    second = client.get("/data")
+    assert second is first
+    assert _Handler.hits == 1
+
+
+def test_cache_key_includes_session_headers(server):
+    client = APIClient(base_url=server, cache_responses=True)
+    client.session.headers["Authorization"] = "Bearer old"
+    assert client.get("/data").json() == {"auth": "Bearer old"}
+
+    client.session.headers["Authorization"] = "Bearer new"
+    assert client.get("/data").json() == {"auth": "Bearer new"}
+    assert _Handler.hits == 2
+
+
+def test_cache_evicts_least_recently_used(server):
+    client = APIClient(base_url=server, cache_responses=True, cache_maxsize=2)
+    for path in ("/a", "/b", "/a", "/c"):
+        client.get(path)
+    assert [key[0].rsplit("/", 1)[1] for key in client._cache] == ["a", "c"]
+
+
+def test_buffered_upload_is_retried_with_full_body(server, tmp_path):
+    upload = tmp_path / "payload.bin"
+    upload.write_bytes(b"x" * 1024)
+    _Handler.post_statuses = [503]
+
+    client = APIClient(base_url=server)
+    response = client.request(
+        "POST", "/upload", files={"file": ("payload.bin", upload.read_bytes())}
+    )
+
+    assert response.status_code == 200
+    assert len(_Handler.post_bodies) == 2
+    assert _Handler.post_bodies[0] == _Handler.post_bodies[1]
+
+
+def test_streamed_body_is_not_retried(server):
+    _Handler.post_statuses = [503]
+
+    client = APIClient(base_url=server)
+    response = client.request("POST", "/upload", data=iter([b"chunk-1", b"chunk-2"]))
+
+    assert response.status_code == 503
+    assert _Handler.post_bodies == [b"chunk-1chunk-2"]
+
+
+def test_upload_file_streams_with_multipart_encoder(server, tmp_path):
+    pytest.importorskip("requests_toolbelt")
+    upload = tmp_path / "payload.txt"
+    upload.write_bytes(b"hello upload")
+    _Handler.post_statuses = [503]
+
+    client = APIClient(base_url=server)
+    response = client.upload_file("/upload", str(upload))
+
+    assert api_client.MULTIPART_ENCODER_AVAILABLE
+    assert response.status_code == 503
+    assert len(_Handler.post_bodies) == 1
+    assert b"hello upload" in _Handler.post_bodies[0]
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+def test_redirects_are_followed(server, http2):
+    if http2:
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    client = APIClient(base_url=server, http2=http2)
+    response = client.get("/old")
+    assert response.status_code == 200
+    assert response.json() == {"auth": None}
+    assert str(response.url).endswith("/data")
+
+
+def test_async_client_http2_is_opt_in(monkeypatch):
+    pytest.importorskip("httpx")
+    monkeypatch.setattr(api_client, "H2_AVAILABLE", False)
+
+    client = api_client.AsyncAPIClient(base_url="http://127.0.0.1")
+    assert client.http2 is False
+
+    with pytest.raises(ImportError, match="h2"):
+        api_client.AsyncAPIClient(base_url="http://127.0.0.1", http2=True)
+
+
+def _open_circuit(base_url):
+    api_client._CIRCUITS[base_url] = {
+        "state": "open",
+        "failures": api_client.CB_THRESHOLD,
+        "opened_at": time.monotonic(),
+    }
+
+
+def test_open_circuit_rejects_without_logging_a_request(server):
+    _open_circuit(server)
+    client = APIClient(base_url=server)
+    messages = []
+    sink_id = logger.add(messages.append, format="{message}")
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError, match="Circuit open"):
+            client.get("/data")
+    finally:
+        logger.remove(sink_id)
+
+    assert not any("API Request" in message for message in messages)
+    assert _Handler.hits == 0
+
+
+def test_circuit_is_shared_by_clients_of_the_same_api(server):
+    APIClient(base_url=server)._cb.update(state="open", opened_at=time.monotonic())
+
+    with pytest.raises(requests.exceptions.ConnectionError, match="Circuit open"):
+        APIClient(base_url=server).get("/data")
+    with pytest.raises(requests.exceptions.ConnectionError, match="Circuit open"):
+        APIClient(base_url=server).download_file("/data", "unused.bin")
+    assert _Handler.hits == 0
+
+
+def test_health_check_bypasses_and_closes_open_circuit(server):
+    _open_circuit(server)
+    client = APIClient(base_url=server)
+
+    assert client.health_check("/health")
+    assert client._cb["state"] == "closed"
+    assert client.get("/data").status_code == 200
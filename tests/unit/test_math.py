@@ -2,461 +2,321 @@
 Unit tests for calculator functionality.
 """
 
+import os
+import sys
+from types import SimpleNamespace
+from typing import List, Tuple, Union
+
 import pytest
 
 from utils.calculator import Calculator
 
-
-class TestCalculator:
-    """Test cases for Calculator class."""
-
-    def setup_method(self):
-        """Setup method called before each test."""
-        print("\n🔧 Setting up Calculator instance...")
-        self.calc = Calculator()
-        print("✅ Calculator instance created successfully")
-
-    def log_test_step(
-        self, step_name, description, input_data=None, expected_result=None
-    ):
-        """Log test step details to console."""
-        print(f"\n📋 {step_name}")
-        print(f"   Description: {description}")
-        if input_data:
-            print(f"   Input: {input_data}")
-        if expected_result:
-            print(f"   Expected: {expected_result}")
-
-    def testAdd(self):
-        """
-        Test addition operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Addition Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM ADDITION =====
-        self.log_test_step("STEP 1", "Perform addition operation", "2 + 3", "5")
-        print("   ➕ Calculating: 2 + 3")
-        result = self.calc.add(2, 3)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate addition result", None, "Result should equal 5"
-        )
-        assert result == 5, f"Expected 5, got {result}"
-        print("   ✅ Addition test passed")
-
-        print("\n🎉 Calculator addition test completed successfully!")
-
-    def testSubtract(self):
-        """
-        Test subtraction operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Subtraction Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM SUBTRACTION =====
-        self.log_test_step("STEP 1", "Perform subtraction operation", "5 - 3", "2")
-        print("   ➖ Calculating: 5 - 3")
-        result = self.calc.subtract(5, 3)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate subtraction result", None, "Result should equal 2"
-        )
-        assert result == 2, f"Expected 2, got {result}"
-        print("   ✅ Subtraction test passed")
-
-        print("\n🎉 Calculator subtraction test completed successfully!")
-
-    def testMultiply(self):
-        """
-        Test multiplication operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Multiplication Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM MULTIPLICATION =====
-        self.log_test_step("STEP 1", "Perform multiplication operation", "4 * 3", "12")
-        print("   ✖️ Calculating: 4 * 3")
-        result = self.calc.multiply(4, 3)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate multiplication result", None, "Result should equal 12"
-        )
-        assert result == 12, f"Expected 12, got {result}"
-        print("   ✅ Multiplication test passed")
-
-        print("\n🎉 Calculator multiplication test completed successfully!")
-
-    def testDivide(self):
-        """
-        Test division operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Division Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM DIVISION =====
-        self.log_test_step("STEP 1", "Perform division operation", "10 / 2", "5")
-        print("   ➗ Calculating: 10 / 2")
-        result = self.calc.divide(10, 2)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate division result", None, "Result should equal 5"
-        )
-        assert result == 5, f"Expected 5, got {result}"
-        print("   ✅ Division test passed")
-
-        print("\n🎉 Calculator division test completed successfully!")
-
-    def testDivideByZero(self):
-        """
-        Test division by zero exception handling
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Division by Zero Exception")
-        print("=" * 80)
-
-        # ===== STEP 1: ATTEMPT DIVISION BY ZERO =====
-        self.log_test_step(
-            "STEP 1", "Attempt division by zero", "10 / 0", "ValueError exception"
-        )
-        print("   ⚠️ Attempting: 10 / 0")
-
-        # ===== STEP 2: VALIDATE EXCEPTION =====
-        self.log_test_step(
-            "STEP 2",
-            "Validate exception is raised",
-            None,
-            "ValueError with specific message",
-        )
-        with pytest.raises(ValueError, match="Cannot divide by zero"):
-            self.calc.divide(10, 0)
-        print("   ✅ Division by zero exception handled correctly")
-
-        print("\n🎉 Calculator division by zero test completed successfully!")
-
-    def testPower(self):
-        """
-        Test power operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Power Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM POWER OPERATION =====
-        self.log_test_step("STEP 1", "Perform power operation", "2 ^ 3", "8")
-        print("   🔢 Calculating: 2 ^ 3")
-        result = self.calc.power(2, 3)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate power result", None, "Result should equal 8"
-        )
-        assert result == 8, f"Expected 8, got {result}"
-        print("   ✅ Power test passed")
-
-        print("\n🎉 Calculator power test completed successfully!")
-
-    def testSqrt(self):
-        """
-        Test square root operation with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Square Root Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM SQUARE ROOT =====
-        self.log_test_step("STEP 1", "Perform square root operation", "√16", "4")
-        print("   √ Calculating: √16")
-        result = self.calc.sqrt(16)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE RESULT =====
-        self.log_test_step(
-            "STEP 2", "Validate square root result", None, "Result should equal 4"
-        )
-        assert result == 4, f"Expected 4, got {result}"
-        print("   ✅ Square root test passed")
-
-        print("\n🎉 Calculator square root test completed successfully!")
-
-    def testSqrtNegative(self):
-        """
-        Test square root of negative number exception handling
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Square Root of Negative Number")
-        print("=" * 80)
-
-        # ===== STEP 1: ATTEMPT SQUARE ROOT OF NEGATIVE =====
-        self.log_test_step(
-            "STEP 1",
-            "Attempt square root of negative number",
-            "√(-1)",
-            "ValueError exception",
-        )
-        print("   ⚠️ Attempting: √(-1)")
-
-        # ===== STEP 2: VALIDATE EXCEPTION =====
-        self.log_test_step(
-            "STEP 2",
-            "Validate exception is raised",
-            None,
-            "ValueError with specific message",
-        )
-        with pytest.raises(
-            ValueError, match="Cannot calculate square root of negative number"
-        ):
-            self.calc.sqrt(-1)
-        print("   ✅ Square root of negative number exception handled correctly")
-
-        print(
-            "\n🎉 Calculator square root of negative number test completed successfully!"
-        )
-
-    @pytest.mark.parametrize(
-        "a, b, expected",
-        [
-            (1, 2, 3),
-            (0, 0, 0),
-            (-1, 1, 0),
-            (100, 200, 300),
-        ],
+# (operation, a, b, expected); b is None for unary operations
+OPS = (
+    ("add", 2, 3, 5),
+    pytest.param("add", 999999999, 1, 1000000000, marks=pytest.mark.slow),
+    ("multiply", 4, 3, 12),
+    ("divide", 10, 2, 5.0),
+    ("power", 2, 3, 8.0),
+    ("sqrt", 16, None, 4.0),
+    pytest.param("add", 1, 1, 2, marks=pytest.mark.critical),
+    pytest.param("subtract", 3, 1, 2, marks=pytest.mark.critical),
+    pytest.param("multiply", 2, 2, 4, marks=pytest.mark.critical),
+    pytest.param("divide", 4, 2, 2.0, marks=pytest.mark.critical),
+)
+
+# (a, b, a + b, a - b); crossed with the add/subtract operations below
+BINARY_CASES = (
+    (1, 2, 3, -1),
+    (0, 0, 0, 0),
+    (-1, 1, 0, -2),
+    (100, 200, 300, -100),
+    (5, 3, 8, 2),
+    (1, 1, 2, 0),
+    (100, 50, 150, 50),
+)
+
+OP_SYMBOLS = {"add": "+", "subtract": "-", "multiply": "*", "divide": "/", "power": "^"}
+
+_BAR = "=" * 80
+_TOP = f"\n{_BAR}"
+
+
+def _discard(line):
+    """Output sink for non-verbose runs."""
+
+
+def _format_step(step_name, description, input_data=None, expected_result=None):
+    """Format a recorded test step."""
+    lines = [f"\n📋 {step_name}", f"   Description: {description}"]
+    if input_data:
+        lines.append(f"   Input: {input_data}")
+    if expected_result:
+        lines.append(f"   Expected: {expected_result}")
+    return "\n".join(lines)
+
+
+_BANNER_DIVIDE_BY_ZERO = (
+    f"{_TOP}\n🧪 TEST: Calculator Division by Zero Exception\n{_BAR}"
+)
+_BANNER_SQRT_NEGATIVE = (
+    f"{_TOP}\n🧪 TEST: Calculator Square Root of Negative Number\n{_BAR}"
+)
+_BANNER_HISTORY = f"{_TOP}\n🧪 TEST: Calculator History Functionality\n{_BAR}"
+_BANNER_CLEAR_HISTORY = (
+    f"{_TOP}\n🧪 TEST: Calculator Clear History Functionality\n{_BAR}"
+)
+_BANNER_HISTORY_LIMIT = f"{_TOP}\n🧪 TEST: Calculator History Limit\n{_BAR}"
+
+
+@pytest.fixture(scope="module")
+def calc():
+    """Shared Calculator for tests that don't inspect history."""
+    return Calculator()
+
+
+@pytest.fixture
+def fresh_calc():
+    """New Calculator for tests that depend on an empty history."""
+    return Calculator()
+
+
+@pytest.fixture
+def out(request, capsys):
+    """
+    Collect test output only for verbose runs and emit it in one write.
+
+    ``out.p`` records a line and ``out.step`` records test step details, which
+    are formatted when the test ends. The write bypasses pytest's capture, so
+    the buffer goes straight to the terminal instead of through the capture
+    layer.
+    """
+    verbose = request.config.getoption("verbose") > 0 or bool(
+        os.environ.get("VERBOSE_TESTS")
     )
-    def testAddParametrized(self, a, b, expected):
-        """
-        Test addition with multiple values using parametrization
-        """
-        print(f"\n🧪 TEST: Calculator Addition Parametrized ({a} + {b} = {expected})")
-
-        # ===== STEP 1: PERFORM PARAMETRIZED ADDITION =====
-        self.log_test_step(
-            "STEP 1", f"Perform addition: {a} + {b}", f"{a} + {b}", expected
-        )
-        print(f"   ➕ Calculating: {a} + {b}")
-        result = self.calc.add(a, b)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE PARAMETRIZED RESULT =====
-        self.log_test_step(
-            "STEP 2",
-            "Validate parametrized result",
-            None,
-            f"Result should equal {expected}",
+    log_buf: List[Union[str, Tuple]] = []
+    emit = log_buf.append if verbose else _discard
+    yield SimpleNamespace(verbose=verbose, p=emit, step=lambda *step: emit(step))
+    if verbose:
+        text = "\n".join(
+            entry if isinstance(entry, str) else _format_step(*entry)
+            for entry in log_buf
         )
-        assert result == expected, f"Expected {expected}, got {result}"
-        print(f"   ✅ Parametrized addition test passed: {a} + {b} = {result}")
-
-    @pytest.mark.parametrize(
-        "a, b, expected",
-        [
-            (5, 3, 2),
-            (0, 0, 0),
-            (1, 1, 0),
-            (100, 50, 50),
-        ],
+        with capsys.disabled():
+            sys.stdout.write(text + "\n")
+
+
+@pytest.mark.parametrize("op, a, b, expected", OPS)
+def test_operation(out, calc, op, a, b, expected):
+    """
+    Test a calculator operation against its expected result
+    """
+    expression = f"√{a}" if b is None else f"{a} {OP_SYMBOLS[op]} {b}"
+    if out.verbose:
+        out.p(f"\n🧪 TEST: Calculator {op} ({expression} = {expected})")
+
+    # ===== STEP 1: PERFORM OPERATION =====
+    out.step("STEP 1", f"Perform {op} operation", expression, expected)
+    operation = getattr(calc, op)
+    result = operation(a) if b is None else operation(a, b)
+    out.p(f"   📊 Result: {result}")
+
+    # ===== STEP 2: VALIDATE RESULT =====
+    out.step("STEP 2", f"Validate {op} result", None, f"Result should equal {expected}")
+    assert result == expected
+    out.p(f"   ✅ {op} test passed: {expression} = {result}")
+
+
+@pytest.mark.parametrize("a, b, expected_add, expected_sub", BINARY_CASES)
+@pytest.mark.parametrize("op", ("add", "subtract"))
+def test_add_subtract(out, calc, op, a, b, expected_add, expected_sub):
+    """
+    Test addition and subtraction over the same operand table
+    """
+    expected = expected_add if op == "add" else expected_sub
+    if out.verbose:
+        out.p(f"\n🧪 TEST: Calculator {op} ({a} {OP_SYMBOLS[op]} {b} = {expected})")
+
+    result = getattr(calc, op)(a, b)
+    out.p(f"   📊 Result: {result}")
+
+    assert result == expected
+
+
+def test_divide_by_zero(out, calc):
+    """
+    Test division by zero exception handling
+    """
+    out.p(_BANNER_DIVIDE_BY_ZERO)
+
+    # ===== STEP 1: ATTEMPT DIVISION BY ZERO =====
+    out.step("STEP 1", "Attempt division by zero", "10 / 0", "ValueError exception")
+    out.p("   ⚠️ Attempting: 10 / 0")
+
+    # ===== STEP 2: VALIDATE EXCEPTION =====
+    out.step(
+        "STEP 2",
+        "Validate exception is raised",
+        None,
+        "ValueError with specific message",
     )
-    def testSubtractParametrized(self, a, b, expected):
-        """
-        Test subtraction with multiple values using parametrization
-        """
-        print(
-            f"\n🧪 TEST: Calculator Subtraction Parametrized ({a} - {b} = {expected})"
-        )
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calc.divide(10, 0)
+    out.p("   ✅ Division by zero exception handled correctly")
 
-        # ===== STEP 1: PERFORM PARAMETRIZED SUBTRACTION =====
-        self.log_test_step(
-            "STEP 1", f"Perform subtraction: {a} - {b}", f"{a} - {b}", expected
-        )
-        print(f"   ➖ Calculating: {a} - {b}")
-        result = self.calc.subtract(a, b)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE PARAMETRIZED RESULT =====
-        self.log_test_step(
-            "STEP 2",
-            "Validate parametrized result",
-            None,
-            f"Result should equal {expected}",
-        )
-        assert result == expected, f"Expected {expected}, got {result}"
-        print(f"   ✅ Parametrized subtraction test passed: {a} - {b} = {result}")
-
-    def testHistory(self):
-        """
-        Test calculator history functionality with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator History Functionality")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM MULTIPLE OPERATIONS =====
-        self.log_test_step(
-            "STEP 1",
-            "Perform multiple operations to build history",
-            "2+3, 5-2, 3*4",
-            "History with 3 entries",
-        )
-        print("   📝 Performing operations to build history...")
+    out.p("\n🎉 Calculator division by zero test completed successfully!")
 
-        print("   ➕ Operation 1: 2 + 3")
-        self.calc.add(2, 3)
 
-        print("   ➖ Operation 2: 5 - 2")
-        self.calc.subtract(5, 2)
+def test_sqrt_negative(out, calc):
+    """
+    Test square root of negative number exception handling
+    """
+    out.p(_BANNER_SQRT_NEGATIVE)
 
-        print("   ✖️ Operation 3: 3 * 4")
-        self.calc.multiply(3, 4)
+    # ===== STEP 1: ATTEMPT SQUARE ROOT OF NEGATIVE =====
+    out.step(
+        "STEP 1",
+        "Attempt square root of negative number",
+        "√(-1)",
+        "ValueError exception",
+    )
+    out.p("   ⚠️ Attempting: √(-1)")
+
+    # ===== STEP 2: VALIDATE EXCEPTION =====
+    out.step(
+        "STEP 2",
+        "Validate exception is raised",
+        None,
+        "ValueError with specific message",
+    )
+    with pytest.raises(
+        ValueError, match="Cannot calculate square root of negative number"
+    ):
+        calc.sqrt(-1)
+    out.p("   ✅ Square root of negative number exception handled correctly")
 
-        # ===== STEP 2: RETRIEVE HISTORY =====
-        self.log_test_step(
-            "STEP 2",
-            "Retrieve calculator history",
-            None,
-            "History should contain 3 entries",
-        )
-        print("   📋 Retrieving calculator history...")
-        history = self.calc.get_history()
-        print(f"   📄 History entries: {history}")
+    out.p("\n🎉 Calculator square root of negative number test completed successfully!")
 
-        # ===== STEP 3: VALIDATE HISTORY =====
-        self.log_test_step(
-            "STEP 3", "Validate history entries", None, "Correct history entries"
-        )
-        print("   🔍 Validating history entries...")
 
-        assert len(history) == 3, f"Expected 3 history entries, got {len(history)}"
-        print("   ✅ History length is correct")
+def test_history(out, fresh_calc):
+    """
+    Test calculator history functionality with detailed logging
+    """
+    out.p(_BANNER_HISTORY)
 
-        assert history[0] == "2 + 3 = 5", f"Expected '2 + 3 = 5', got '{history[0]}'"
-        assert history[1] == "5 - 2 = 3", f"Expected '5 - 2 = 3', got '{history[1]}'"
-        assert history[2] == "3 * 4 = 12", f"Expected '3 * 4 = 12', got '{history[2]}'"
-        print("   ✅ All history entries are correct")
+    # ===== STEP 1: PERFORM MULTIPLE OPERATIONS =====
+    out.step(
+        "STEP 1",
+        "Perform multiple operations to build history",
+        "2+3, 5-2, 3*4",
+        "History with 3 entries",
+    )
+    out.p("   📝 Performing operations to build history...")
 
-        print("\n🎉 Calculator history test completed successfully!")
+    out.p("   ➕ Operation 1: 2 + 3")
+    fresh_calc.add(2, 3)
 
-    def testClearHistory(self):
-        """
-        Test clearing calculator history with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Clear History Functionality")
-        print("=" * 80)
+    out.p("   ➖ Operation 2: 5 - 2")
+    fresh_calc.subtract(5, 2)
 
-        # ===== STEP 1: ADD OPERATION TO HISTORY =====
-        self.log_test_step(
-            "STEP 1", "Add operation to history", "2 + 3", "History with 1 entry"
-        )
-        print("   ➕ Adding operation to history: 2 + 3")
-        self.calc.add(2, 3)
+    out.p("   ✖️ Operation 3: 3 * 4")
+    fresh_calc.multiply(3, 4)
 
-        # ===== STEP 2: CLEAR HISTORY =====
-        self.log_test_step(
-            "STEP 2", "Clear calculator history", None, "History should be empty"
-        )
-        print("   🗑️ Clearing calculator history...")
-        self.calc.clear_history()
-
-        # ===== STEP 3: VALIDATE CLEARED HISTORY =====
-        self.log_test_step(
-            "STEP 3",
-            "Validate history is cleared",
-            None,
-            "History should have 0 entries",
-        )
-        print("   🔍 Validating history is cleared...")
-        history = self.calc.get_history()
-        print(f"   📄 History after clearing: {history}")
-
-        assert len(history) == 0, f"Expected 0 history entries, got {len(history)}"
-        print("   ✅ History cleared successfully")
-
-        print("\n🎉 Calculator clear history test completed successfully!")
-
-    @pytest.mark.slow
-    def testLargeNumbers(self):
-        """
-        Test operations with large numbers with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Large Numbers Operation")
-        print("=" * 80)
-
-        # ===== STEP 1: PERFORM OPERATION WITH LARGE NUMBERS =====
-        large_num = 999999999
-        self.log_test_step(
-            "STEP 1",
-            "Perform addition with large numbers",
-            f"{large_num} + 1",
-            "1000000000",
-        )
-        print(f"   ➕ Calculating: {large_num} + 1")
-        result = self.calc.add(large_num, 1)
-        print(f"   📊 Result: {result}")
-
-        # ===== STEP 2: VALIDATE LARGE NUMBER RESULT =====
-        self.log_test_step(
-            "STEP 2",
-            "Validate large number result",
-            None,
-            "Result should equal 1000000000",
-        )
-        assert result == 1000000000, f"Expected 1000000000, got {result}"
-        print("   ✅ Large numbers test passed")
-
-        print("\n🎉 Calculator large numbers test completed successfully!")
-
-    @pytest.mark.critical
-    def testBasicOperations(self):
-        """
-        Critical test for basic operations with detailed logging
-        """
-        print("\n" + "=" * 80)
-        print("🧪 TEST: Calculator Critical Basic Operations")
-        print("=" * 80)
-
-        # ===== STEP 1: TEST ADDITION =====
-        self.log_test_step("STEP 1", "Test critical addition", "1 + 1", "2")
-        print("   ➕ Critical addition: 1 + 1")
-        add_result = self.calc.add(1, 1)
-        print(f"   📊 Addition result: {add_result}")
-        assert add_result == 2, f"Expected 2, got {add_result}"
-        print("   ✅ Critical addition passed")
-
-        # ===== STEP 2: TEST SUBTRACTION =====
-        self.log_test_step("STEP 2", "Test critical subtraction", "3 - 1", "2")
-        print("   ➖ Critical subtraction: 3 - 1")
-        sub_result = self.calc.subtract(3, 1)
-        print(f"   📊 Subtraction result: {sub_result}")
-        assert sub_result == 2, f"Expected 2, got {sub_result}"
-        print("   ✅ Critical subtraction passed")
-
-        # ===== STEP 3: TEST MULTIPLICATION =====
-        self.log_test_step("STEP 3", "Test critical multiplication", "2 * 2", "4")
-        print("   ✖️ Critical multiplication: 2 * 2")
-        mul_result = self.calc.multiply(2, 2)
-        print(f"   📊 Multiplication result: {mul_result}")
-        assert mul_result == 4, f"Expected 4, got {mul_result}"
-        print("   ✅ Critical multiplication passed")
-
-        # ===== STEP 4: TEST DIVISION =====
-        self.log_test_step("STEP 4", "Test critical division", "4 / 2", "2")
-        print("   ➗ Critical division: 4 / 2")
-        div_result = self.calc.divide(4, 2)
-        print(f"   📊 Division result: {div_result}")
-        assert div_result == 2, f"Expected 2, got {div_result}"
-        print("   ✅ Critical division passed")
-
-        print("\n🎉 Calculator critical basic operations test completed successfully!")
+    # ===== STEP 2: RETRIEVE HISTORY =====
+    out.step(
+        "STEP 2",
+        "Retrieve calculator history",
+        None,
+        "History should contain 3 entries",
+    )
+    out.p("   📋 Retrieving calculator history...")
+    history = fresh_calc.get_history()
+    out.p(f"   📄 History entries: {history}")
+
+    # ===== STEP 3: VALIDATE HISTORY =====
+    out.step("STEP 3", "Validate history entries", None, "Correct history entries")
+    out.p("   🔍 Validating history entries...")
+
+    assert history == ["2 + 3 = 5", "5 - 2 = 3", "3 * 4 = 12"]
+    out.p("   ✅ All history entries are correct")
+
+    out.p("\n🎉 Calculator history test completed successfully!")
+
+
+def test_clear_history(out, fresh_calc):
+    """
+    Test clearing calculator history with detailed logging
+    """
+    out.p(_BANNER_CLEAR_HISTORY)
+
+    # ===== STEP 1: ADD OPERATION TO HISTORY =====
+    out.step("STEP 1", "Add operation to history", "2 + 3", "History with 1 entry")
+    out.p("   ➕ Adding operation to history: 2 + 3")
+    fresh_calc.add(2, 3)
+
+    # ===== STEP 2: CLEAR HISTORY =====
+    out.step("STEP 2", "Clear calculator history", None, "History should be empty")
+    out.p("   🗑️ Clearing calculator history...")
+    fresh_calc.clear_history()
+
+    # ===== STEP 3: VALIDATE CLEARED HISTORY =====
+    out.step(
+        "STEP 3",
+        "Validate history is cleared",
+        None,
+        "History should have 0 entries",
+    )
+    out.p("   🔍 Validating history is cleared...")
+    history = fresh_calc.get_history()
+    out.p(f"   📄 History after clearing: {history}")
+
+    assert len(history) == 0
+    out.p("   ✅ History cleared successfully")
+
+    out.p("\n🎉 Calculator clear history test completed successfully!")
+
+
+def test_history_limit(out):
+    """
+    Test that history keeps only the most recent calculations
+    """
+    out.p(_BANNER_HISTORY_LIMIT)
+
+    # ===== STEP 1: OVERFLOW A SMALL HISTORY =====
+    out.step("STEP 1", "Perform more operations than the limit", "max_history=2")
+    calc = Calculator(max_history=2)
+    calc.add(1, 1)
+    calc.multiply(2, 3)
+    calc.sqrt(16)
+
+    # ===== STEP 2: VALIDATE RETAINED ENTRIES =====
+    out.step("STEP 2", "Validate retained entries", None, "Last 2 entries kept")
+    assert calc.get_history() == ["2 * 3 = 6", "√16 = 4.0"]
+    assert calc.get_last_result() == 4.0
+    out.p("   ✅ Oldest entry dropped, last result intact")
+
+
+def test_array_operations(out, calc):
+    """
+    Test batch operations on NumPy arrays
+    """
+    np = pytest.importorskip("numpy")
+    a = np.array([1.0, 4.0, 9.0])
+    b = np.array([1.0, 2.0, 3.0])
+
+    out.step("STEP 1", "Run batch operations", f"a={a}, b={b}")
+    assert calc.add_array(a, b).tolist() == [2.0, 6.0, 12.0]
+    assert calc.subtract_array(a, b).tolist() == [0.0, 2.0, 6.0]
+    assert calc.multiply_array(a, b).tolist() == [1.0, 8.0, 27.0]
+    assert calc.divide_array(a, b).tolist() == [1.0, 2.0, 3.0]
+    assert calc.power_array(b, 2).tolist() == [1.0, 4.0, 9.0]
+    assert calc.sqrt_array(a).tolist() == [1.0, 2.0, 3.0]
+
+    out.step("STEP 2", "Validate batch errors", None, "ValueError")
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calc.divide_array(a, np.array([1.0, 0.0, 1.0]))
+    with pytest.raises(
+        ValueError, match="Cannot calculate square root of negative number"
+    ):
+        calc.sqrt_array(np.array([4.0, -1.0]))
+    out.p("   ✅ Batch operations match their scalar counterparts")
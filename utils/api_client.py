@@ -2,9 +2,14 @@
 API client for making HTTP requests and API testing.
 """
 
+import asyncio
+import importlib.util
 import json
+import os
+import random
 import time
-from typing import Any, Dict, Optional, Union
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import requests
 
@@ -14,16 +19,93 @@ try:
     HTTPX_AVAILABLE = True
 except ImportError:
     HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = json.loads
+
+try:
+    from requests_toolbelt import MultipartEncoder
+
+    MULTIPART_ENCODER_AVAILABLE = True
+except ImportError:
+    MULTIPART_ENCODER_AVAILABLE = False
 from requests.adapters import HTTPAdapter
+from requests.cookies import extract_cookies_to_jar
 from urllib3.util.retry import Retry
 
 from utils.logger import logger
 
+# HTTP/2 in httpx needs the optional h2 package (pip install 'httpx[http2]')
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_FACTOR = 1
+
+# Circuit breaker: open after this many consecutive failures, probe again after cooldown
+CB_THRESHOLD = 5
+CB_COOLDOWN = 30
+
+# base_url -> circuit state, shared by every client (and test) hitting that API
+_CIRCUITS: Dict[str, Dict[str, Any]] = {}
+
+# Most GET responses kept for ETag/Last-Modified revalidation when caching is on
+CACHE_MAXSIZE = 128
+
+# Status polling starts at the given interval and grows by this factor per attempt
+POLL_BACKOFF_MULTIPLIER = 1.5
+
+if HTTPX_AVAILABLE:
+    REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
+
+class _FullJitterRetry(Retry):
+    """urllib3 Retry that sleeps a random time up to the exponential backoff."""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+def _is_one_shot(body: Any) -> bool:
+    """Whether ``body`` is a stream that can only be read once (no rewind on retry)."""
+    if body is None or isinstance(body, (bytes, str, dict, list, tuple)):
+        return False
+    if hasattr(body, "read"):
+        return not hasattr(body, "seek")
+    return hasattr(body, "__next__")
+
+
+def _body_preview(response) -> Any:
+    """Decoded JSON body, or the start of the text body if it isn't JSON."""
+    try:
+        return _loads(response.content)
+    except json.JSONDecodeError:
+        return f"{response.text[:500]}..."
+
 
 class APIClient:
     """HTTP client for API testing with retry logic and logging."""
 
-    def __init__(self, base_url: str = "", timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool_connections: int = 32,
+        pool_maxsize: int = 128,
+        http2: bool = False,
+        cache_responses: bool = False,
+        cache_maxsize: int = CACHE_MAXSIZE,
+        circuit_threshold: int = CB_THRESHOLD,
+        circuit_cooldown: float = CB_COOLDOWN,
+    ):
         """
         Initialize API client.
 
@@ -31,47 +113,101 @@ class APIClient:
             base_url: Base URL for API requests
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
+            pool_connections: Number of per-host connection pools to keep
+                (keep-alive connections when http2 is enabled)
+            pool_maxsize: Maximum connections kept per pool
+                (total connections when http2 is enabled)
+            http2: Use an HTTP/2 httpx.Client instead of a requests.Session
+            cache_responses: Revalidate repeated GETs with ETag/Last-Modified
+            cache_maxsize: Most responses kept in the cache (least recently used
+                are evicted first)
+            circuit_threshold: Consecutive failures that open the circuit
+            circuit_cooldown: Seconds an open circuit fails fast before a probe
         """
         self.base_url = base_url.rstrip("/")
+        self._base_prefix = self.base_url + "/"
         self.timeout = timeout
-        self.session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=[
-                "HEAD",
-                "GET",
-                "OPTIONS",
-                "POST",
-                "PUT",
-                "DELETE",
-                "PATCH",
-            ],
-            backoff_factor=1,
+        self.max_retries = max_retries
+        self.http2 = http2
+        self.cache_responses = cache_responses
+        self.cache_maxsize = cache_maxsize
+        self.circuit_threshold = circuit_threshold
+        self.circuit_cooldown = circuit_cooldown
+        self._cb = _CIRCUITS.setdefault(
+            self.base_url, {"state": "closed", "failures": 0, "opened_at": 0.0}
+        )
+        # (url, params, effective headers) -> (etag, last_modified, response)
+        self._cache: "OrderedDict[Tuple[str, str, Tuple], Tuple[Any, ...]]" = (
+            OrderedDict()
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        if http2:
+            if not HTTPX_AVAILABLE:
+                raise ImportError(
+                    "httpx is not installed. Install it with: pip install 'httpx[http2]'"
+                )
+            # requests follows redirects by default; httpx has to be told to
+            self.session = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_connections,
+                ),
+            )
+        else:
+            self.session = requests.Session()
+
+            # Configure retry strategy
+            retry_strategy = _FullJitterRetry(
+                total=max_retries,
+                status_forcelist=sorted(RETRY_STATUSES),
+                allowed_methods=[
+                    "HEAD",
+                    "GET",
+                    "OPTIONS",
+                    "POST",
+                    "PUT",
+                    "DELETE",
+                    "PATCH",
+                ],
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+            )
+
+            adapter = HTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=False,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+            # One-shot streamed bodies can't be replayed, so they skip the retries
+            self._stream_adapter = HTTPAdapter(
+                max_retries=0, pool_connections=1, pool_maxsize=pool_maxsize
+            )
 
-        # Default headers
+        # Default headers; Content-Type is left to the transport, which sets
+        # application/json for json= bodies and the right type for form/multipart
         self.session.headers.update(
             {
-                "Content-Type": "application/json",
                 "Accept": "application/json",
                 "User-Agent": "Pytest-Automation-Framework/1.0",
             }
         )
 
+        self._session_request = self.session.request
+
         logger.info(f"API client initialized with base URL: {base_url}")
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        if endpoint.startswith("http"):
+        if endpoint[:4] == "http":
             return endpoint
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        if endpoint[:1] == "/":
+            endpoint = endpoint.lstrip("/")
+        return self._base_prefix + endpoint
 
     def _log_request(
         self, method: str, url: str, headers: dict = None, data: Any = None
@@ -79,25 +215,81 @@ class APIClient:
         """Log request details."""
         logger.info(f"🌐 API Request: {method} {url}")
         if headers:
-            logger.debug(f"Headers: {headers}")
+            logger.debug("Headers: {}", headers)
         if data:
-            logger.debug(f"Data: {data}")
+            logger.debug("Data: {}", data)
 
     def _log_response(self, response: requests.Response, duration: float):
         """Log response details."""
         status_code = response.status_code
-        if 200 <= status_code < 300:
+        if 200 <= status_code < 300 or status_code == 304:
             logger.info(f"✅ API Response: {status_code}")
         else:
             logger.error(f"❌ API Response: {status_code}")
 
         logger.info(f"⏱️ API call duration: {duration:.2f} seconds")
 
-        try:
-            response_data = response.json()
-            logger.debug(f"Response data: {response_data}")
-        except json.JSONDecodeError:
-            logger.debug(f"Response text: {response.text[:500]}...")
+        # Only decoded when a DEBUG sink will actually emit the record
+        logger.opt(lazy=True).debug(
+            "Response data: {}", lambda: _body_preview(response)
+        )
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Send a request, retrying on the httpx transport like the requests adapter."""
+        if not self.http2:
+            if _is_one_shot(kwargs.get("data")):
+                return self._send_once(method, url, **kwargs)
+            return self._session_request(method, url, **kwargs)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                response = self._session_request(method, url, **kwargs)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if last_attempt or response.status_code not in RETRY_STATUSES:
+                    return response
+            time.sleep(random.uniform(0, RETRY_BACKOFF_FACTOR * (2**attempt)))
+
+    def _send_once(self, method: str, url: str, timeout=None, **kwargs):
+        """Send through the retry-less adapter; a retry would resend a drained body."""
+        prepared = self.session.prepare_request(requests.Request(method, url, **kwargs))
+        response = self._stream_adapter.send(prepared, timeout=timeout)
+        extract_cookies_to_jar(self.session.cookies, prepared, response.raw)
+        return response
+
+    def _check_circuit(self):
+        """Fail fast while the circuit is open; let one probe through after cooldown."""
+        cb = self._cb
+        if cb["state"] != "open":
+            return
+        if time.monotonic() - cb["opened_at"] < self.circuit_cooldown:
+            raise requests.exceptions.ConnectionError(
+                f"Circuit open for {self.base_url or 'API'}, failing fast"
+            )
+        cb["state"] = "half-open"
+        logger.warning(f"🔌 Circuit half-open, probing {self.base_url}")
+
+    def _record_outcome(self, ok: bool):
+        """Update the circuit breaker with the result of a request."""
+        cb = self._cb
+        if ok:
+            if cb["state"] != "closed":
+                logger.info(f"🔌 Circuit closed for {self.base_url}")
+            cb["state"] = "closed"
+            cb["failures"] = 0
+            return
+
+        cb["failures"] += 1
+        if cb["state"] == "half-open" or cb["failures"] >= self.circuit_threshold:
+            if cb["state"] != "open":
+                logger.error(
+                    f"🔌 Circuit opened for {self.base_url} after {cb['failures']} failures"
+                )
+            cb["state"] = "open"
+            cb["opened_at"] = time.monotonic()
 
     def request(
         self,
@@ -109,6 +301,7 @@ class APIClient:
         params: Dict[str, Any] = None,
         files: Dict[str, Any] = None,
         timeout: int = None,
+        use_circuit: bool = True,
     ) -> requests.Response:
         """
         Make an HTTP request.
@@ -122,25 +315,47 @@ class APIClient:
             params: Query parameters
             files: Files to upload
             timeout: Request timeout
+            use_circuit: Fail fast while the circuit is open; pass False to
+                send anyway (the outcome still updates the circuit)
 
         Returns:
-            Response object
+            Response object (httpx.Response when the client uses http2)
         """
         url = self._build_url(endpoint)
         timeout = timeout or self.timeout
 
-        # Prepare request data
-        request_data = {}
-        if headers:
-            request_data["headers"] = headers
-        if data:
-            request_data["data"] = data
-        if json_data:
-            request_data["json"] = json_data
-        if params:
-            request_data["params"] = params
-        if files:
-            request_data["files"] = files
+        # Revalidate a cached GET instead of downloading it again
+        request_headers = headers
+        cache_key = cached = None
+        if self.cache_responses and method.upper() == "GET":
+            cache_key = (url, repr(params), self._effective_headers(headers))
+            cached = self._cache.get(cache_key)
+            if cached:
+                self._cache.move_to_end(cache_key)
+                etag, last_modified, _ = cached
+                conditional = dict(headers or {})
+                if etag:
+                    conditional["If-None-Match"] = etag
+                if last_modified:
+                    conditional["If-Modified-Since"] = last_modified
+                request_headers = conditional
+
+        # Encode JSON bodies with orjson; requests would use json.dumps
+        body, json_body = data, json_data
+        if ORJSON_AVAILABLE and not self.http2 and json_data is not None and not data:
+            try:
+                body = orjson.dumps(json_data)
+            except TypeError:
+                pass  # types orjson can't encode fall back to requests
+            else:
+                json_body = None
+                request_headers = dict(request_headers or {})
+                if not any(k.lower() == "content-type" for k in request_headers):
+                    request_headers["Content-Type"] = "application/json"
+
+        # Fail fast before logging, so only dispatched requests are logged
+        if use_circuit:
+            self._check_circuit()
 
         # Log request
         self._log_request(method, url, headers, data or json_data)
@@ -148,19 +363,53 @@ class APIClient:
         # Make request
         start_time = time.time()
         try:
-            response = self.session.request(
-                method=method.upper(), url=url, timeout=timeout, **request_data
+            response = self._send(
+                method.upper(),
+                url,
+                timeout=timeout,
+                headers=request_headers,
+                data=body,
+                json=json_body,
+                params=params,
+                files=files,
             )
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
+            self._record_outcome(False)
             logger.error(f"Request failed: {str(e)}")
             raise
+        self._record_outcome(response.status_code < 500)
 
         # Log response
         duration = time.time() - start_time
         self._log_response(response, duration)
 
+        if cache_key is not None:
+            if response.status_code == 304 and cached:
+                logger.debug("♻️ Not modified, using cached response: {}", url)
+                return cached[2]
+            if response.status_code == 200:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._cache[cache_key] = (etag, last_modified, response)
+                    self._cache.move_to_end(cache_key)
+                    if len(self._cache) > self.cache_maxsize:
+                        self._cache.popitem(last=False)
+
         return response
 
+    def _effective_headers(self, headers: Optional[Dict[str, str]]) -> Tuple:
+        """Session headers merged with per-call headers, as a hashable cache key part."""
+        merged = {k.lower(): v for k, v in self.session.headers.items()}
+        if headers:
+            merged.update((k.lower(), v) for k, v in headers.items())
+        return tuple(sorted(merged.items()))
+
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._cache.clear()
+        logger.info("API response cache cleared")
+
     def get(
         self,
         endpoint: str,
@@ -242,32 +491,95 @@ class APIClient:
             Response object
         """
         with open(file_path, "rb") as f:
-            files = {field_name: f}
-            return self.post(endpoint, files=files, headers=headers)
+            upload = (os.path.basename(file_path), f, "application/octet-stream")
+            if MULTIPART_ENCODER_AVAILABLE and not self.http2:
+                # Stream the multipart body from disk instead of building it in memory
+                encoder = MultipartEncoder(fields={field_name: upload})
+                headers = {**(headers or {}), "Content-Type": encoder.content_type}
+                return self.request("POST", endpoint, data=encoder, headers=headers)
+            return self.request(
+                "POST", endpoint, files={field_name: upload}, headers=headers
+            )
 
     def download_file(
-        self, endpoint: str, file_path: str, headers: Dict[str, str] = None
+        self,
+        endpoint: str,
+        file_path: str,
+        headers: Dict[str, str] = None,
+        chunk_size: int = 64 * 1024,
+        progress_cb: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> str:
         """
-        Download a file.
+        Download a file, streaming it to disk in chunks.
 
         Args:
             endpoint: API endpoint
             file_path: Path to save the file
             headers: Request headers
+            chunk_size: Bytes read per chunk
+            progress_cb: Called with (bytes_written, total_bytes or None)
+                after each chunk
 
         Returns:
             Path to downloaded file
         """
-        response = self.get(endpoint, headers=headers)
-        response.raise_for_status()
+        url = self._build_url(endpoint)
+        self._check_circuit()
+        self._log_request("GET", url, headers)
 
-        with open(file_path, "wb") as f:
-            f.write(response.content)
+        response = None
+        try:
+            if self.http2:
+                with self.session.stream(
+                    "GET", url, headers=headers, timeout=self.timeout
+                ) as response:
+                    self._record_outcome(response.status_code < 500)
+                    self._write_stream(
+                        response,
+                        response.iter_bytes(chunk_size),
+                        file_path,
+                        progress_cb,
+                    )
+            else:
+                with self.session.get(
+                    url, headers=headers, stream=True, timeout=self.timeout
+                ) as response:
+                    self._record_outcome(response.status_code < 500)
+                    self._write_stream(
+                        response,
+                        response.iter_content(chunk_size=chunk_size),
+                        file_path,
+                        progress_cb,
+                    )
+        except REQUEST_ERRORS:
+            # Status errors were already recorded once the response arrived
+            if response is None:
+                self._record_outcome(False)
+            raise
 
         logger.info(f"File downloaded: {file_path}")
         return file_path
 
+    @staticmethod
+    def _write_stream(
+        response: Any,
+        chunks: Iterable[bytes],
+        file_path: str,
+        progress_cb: Optional[Callable[[int, Optional[int]], None]],
+    ):
+        """Write a streamed response body to file_path."""
+        response.raise_for_status()
+        length = response.headers.get("Content-Length")
+        total = int(length) if length else None
+        written = 0
+
+        with open(file_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                if progress_cb:
+                    written += len(chunk)
+                    progress_cb(written, total)
+
     def set_auth(self, auth_type: str, **kwargs):
         """
         Set authentication for requests.
@@ -277,10 +589,8 @@ class APIClient:
             **kwargs: Authentication parameters
         """
         if auth_type.lower() == "basic":
-            from requests.auth import HTTPBasicAuth
-
-            auth = HTTPBasicAuth(kwargs.get("username"), kwargs.get("password"))
-            self.session.auth = auth
+            # requests and httpx both accept a (username, password) tuple
+            self.session.auth = (kwargs.get("username"), kwargs.get("password"))
         elif auth_type.lower() == "bearer":
             token = kwargs.get("token")
             self.session.headers.update({"Authorization": f"Bearer {token}"})
@@ -363,7 +673,7 @@ class APIClient:
         try:
             from jsonschema import validate
 
-            response_data = response.json()
+            response_data = _loads(response.content)
             validate(instance=response_data, schema=schema)
             logger.info("JSON schema validation passed")
             return True
@@ -376,7 +686,8 @@ class APIClient:
         endpoint: str,
         expected_status: int = 200,
         max_wait: int = 60,
-        interval: int = 5,
+        interval: float = 1,
+        max_interval: float = 10,
     ) -> bool:
         """
         Wait for endpoint to return expected status.
@@ -385,28 +696,33 @@ class APIClient:
             endpoint: API endpoint
             expected_status: Expected status code
             max_wait: Maximum wait time in seconds
-            interval: Check interval in seconds
+            interval: Initial check interval in seconds, grown 1.5x per check
+            max_interval: Upper bound for the check interval in seconds
+
+        Polling ignores an open circuit, and a matching status closes it.
 
         Returns:
             True if status matches within timeout, False otherwise
         """
         start_time = time.time()
+        deadline = start_time + max_wait
 
-        while time.time() - start_time < max_wait:
+        while time.time() < deadline:
             try:
-                response = self.get(endpoint)
+                response = self.request("GET", endpoint, use_circuit=False)
                 if response.status_code == expected_status:
                     logger.info(
                         f"Endpoint {endpoint} returned expected status {expected_status}"
                     )
                     return True
-            except requests.exceptions.RequestException:
+            except REQUEST_ERRORS:
                 pass
 
             logger.debug(
-                f"Waiting for endpoint {endpoint} to return status {expected_status}"
+                "Waiting for endpoint {} to return status {}", endpoint, expected_status
             )
-            time.sleep(interval)
+            time.sleep(max(0, min(interval, deadline - time.time())))
+            interval = min(interval * POLL_BACKOFF_MULTIPLIER, max_interval)
 
         logger.error(
             f"Endpoint {endpoint} did not return status {expected_status} within {max_wait} seconds"
@@ -417,6 +733,9 @@ class APIClient:
         """
         Perform health check on API.
 
+        The check is sent even while the circuit is open; a healthy answer
+        closes it.
+
         Args:
             endpoint: Health check endpoint
 
@@ -424,13 +743,13 @@ class APIClient:
             True if healthy, False otherwise
         """
         try:
-            response = self.get(endpoint)
+            response = self.request("GET", endpoint, use_circuit=False)
             is_healthy = response.status_code == 200
             logger.info(
                 f"Health check {'passed' if is_healthy else 'failed'}: {response.status_code}"
             )
             return is_healthy
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             logger.error(f"Health check failed: {str(e)}")
             return False
 
@@ -451,26 +770,45 @@ class APIClient:
 class AsyncAPIClient:
     """Async HTTP client for API testing."""
 
-    def __init__(self, base_url: str = "", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: int = 30,
+        max_concurrency: int = 100,
+        http2: bool = False,
+    ):
         """
         Initialize async API client.
 
         Args:
             base_url: Base URL for API requests
             timeout: Request timeout in seconds
+            max_concurrency: Maximum number of requests in flight at once
+            http2: Negotiate HTTP/2 (needs the h2 package)
         """
         if not HTTPX_AVAILABLE:
             raise ImportError(
                 "httpx is not installed. Install it with: pip install httpx"
             )
+        if http2 and not H2_AVAILABLE:
+            raise ImportError(
+                "h2 is not installed. Install it with: pip install 'httpx[http2]'"
+            )
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.http2 = http2
+        self._sem = asyncio.Semaphore(max_concurrency)
         self.client = httpx.AsyncClient(
             base_url=base_url,
             timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency // 2,
+            ),
             headers={
-                "Content-Type": "application/json",
                 "Accept": "application/json",
                 "User-Agent": "Pytest-Automation-Framework/1.0",
             },
@@ -487,42 +825,45 @@ class AsyncAPIClient:
         json_data: Dict[str, Any] = None,
         params: Dict[str, Any] = None,
     ) -> "httpx.Response":
-        """Make an async HTTP request."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-
-        # Log request
-        logger.info(f"🌐 Async API Request: {method} {url}")
-        if headers:
-            logger.debug(f"Headers: {headers}")
-        if data or json_data:
-            logger.debug(f"Data: {data or json_data}")
-
-        # Make request
-        start_time = time.time()
-        try:
-            response = await self.client.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                data=data,
-                json=json_data,
-                params=params,
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Async request failed: {str(e)}")
-            raise
-
-        # Log response
-        duration = time.time() - start_time
-        status_code = response.status_code
-        if 200 <= status_code < 300:
-            logger.info(f"✅ Async API Response: {status_code}")
-        else:
-            logger.error(f"❌ Async API Response: {status_code}")
-
-        logger.info(f"⏱️ Async API call duration: {duration:.2f} seconds")
+        """
+        Make an async HTTP request.
 
-        return response
+        Relative endpoints are resolved against base_url by httpx.
+        """
+        async with self._sem:
+            # Log request
+            logger.info("🌐 Async API Request: {} {}", method, endpoint)
+            if headers:
+                logger.debug("Headers: {}", headers)
+            if data or json_data:
+                logger.debug("Data: {}", data or json_data)
+
+            # Make request
+            start_time = time.time()
+            try:
+                response = await self.client.request(
+                    method=method.upper(),
+                    url=endpoint,
+                    headers=headers,
+                    data=data,
+                    json=json_data,
+                    params=params,
+                )
+            except httpx.RequestError as e:
+                logger.error("Async request failed: {}", e)
+                raise
+
+            # Log response
+            duration = time.time() - start_time
+            status_code = response.status_code
+            if 200 <= status_code < 300:
+                logger.info("✅ Async API Response: {}", status_code)
+            else:
+                logger.error("❌ Async API Response: {}", status_code)
+
+            logger.info("⏱️ Async API call duration: {:.2f} seconds", duration)
+
+            return response
 
     async def get(
         self,
@@ -563,6 +904,91 @@ class AsyncAPIClient:
         """Make an async DELETE request."""
         return await self.request("DELETE", endpoint, headers=headers)
 
+    async def wait_for_statuses(
+        self,
+        endpoints: Iterable[str],
+        expected_status: int = 200,
+        max_wait: float = 60,
+        interval: float = 1,
+        max_interval: float = 10,
+    ) -> Dict[str, bool]:
+        """
+        Poll several endpoints concurrently until each returns expected status.
+
+        Args:
+            endpoints: API endpoints to poll
+            expected_status: Expected status code
+            max_wait: Maximum total wait time in seconds
+            interval: Initial check interval in seconds, grown 1.5x per check
+            max_interval: Upper bound for the check interval in seconds
+
+        Returns:
+            Mapping of endpoint to whether it reached the status in time
+        """
+
+        async def poll(endpoint: str) -> None:
+            delay = interval
+            while True:
+                try:
+                    response = await self.get(endpoint)
+                    if response.status_code == expected_status:
+                        return
+                except httpx.HTTPError:
+                    pass
+                await asyncio.sleep(delay)
+                delay = min(delay * POLL_BACKOFF_MULTIPLIER, max_interval)
+
+        tasks = {
+            endpoint: asyncio.create_task(poll(endpoint)) for endpoint in endpoints
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=max_wait)
+
+        results = {}
+        for endpoint, task in tasks.items():
+            results[endpoint] = task.done() and task.exception() is None
+            if not task.done():
+                task.cancel()
+                logger.error(
+                    f"Endpoint {endpoint} did not return status {expected_status} within {max_wait} seconds"
+                )
+        return results
+
+    async def gather(
+        self, calls: Iterable[Tuple[Any, ...]]
+    ) -> AsyncIterator["httpx.Response"]:
+        """
+        Run many requests concurrently, yielding responses as they complete.
+
+        Calls are pulled from the iterable lazily, so at most max_concurrency
+        requests are scheduled at any time.
+
+        Args:
+            calls: (method, endpoint) or (method, endpoint, kwargs) tuples
+
+        Yields:
+            Responses in completion order
+        """
+        pending = set()
+        try:
+            for method, endpoint, *rest in calls:
+                kwargs = rest[0] if rest else {}
+                pending.add(
+                    asyncio.ensure_future(self.request(method, endpoint, **kwargs))
+                )
+                if len(pending) >= self.max_concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def close(self):
         """Close the async client."""
         await self.client.aclose()
@@ -3,15 +3,37 @@ Calculator utility class for mathematical operations.
 """
 
 import math
-from typing import List
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# (operator, a, b, result); b is None for unary operations
+HistoryEntry = Tuple[str, float, Optional[float], float]
+
+
+def _require_numpy():
+    """Raise if the optional NumPy dependency is missing."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is not installed. Install it with: pip install numpy")
 
 
 class Calculator:
     """Simple calculator class for mathematical operations."""
 
-    def __init__(self):
-        """Initialize calculator with empty history."""
-        self.history: List[str] = []
+    def __init__(self, max_history: Optional[int] = 1000):
+        """
+        Initialize calculator with empty history.
+
+        Args:
+            max_history: Number of calculations to keep (None keeps all)
+        """
+        self.history: Deque[HistoryEntry] = deque(maxlen=max_history)
 
     def add(self, a: float, b: float) -> float:
         """
@@ -25,7 +47,7 @@ class Calculator:
             Sum of the two numbers
         """
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append(("+", a, b, result))
         return result
 
     def subtract(self, a: float, b: float) -> float:
@@ -40,7 +62,7 @@ class Calculator:
             Difference of the two numbers
         """
         result = a - b
-        self.history.append(f"{a} - {b} = {result}")
+        self.history.append(("-", a, b, result))
         return result
 
     def multiply(self, a: float, b: float) -> float:
@@ -55,7 +77,7 @@ class Calculator:
             Product of the two numbers
         """
         result = a * b
-        self.history.append(f"{a} * {b} = {result}")
+        self.history.append(("*", a, b, result))
         return result
 
     def divide(self, a: float, b: float) -> float:
@@ -76,7 +98,7 @@ class Calculator:
             raise ValueError("Cannot divide by zero")
 
         result = a / b
-        self.history.append(f"{a} / {b} = {result}")
+        self.history.append(("/", a, b, result))
         return result
 
     def power(self, base: float, exponent: float) -> float:
@@ -91,7 +113,7 @@ class Calculator:
             Base raised to the power of exponent
         """
         result = math.pow(base, exponent)
-        self.history.append(f"{base} ^ {exponent} = {result}")
+        self.history.append(("^", base, exponent, result))
         return result
 
     def sqrt(self, number: float) -> float:
@@ -111,9 +133,25 @@ class Calculator:
             raise ValueError("Cannot calculate square root of negative number")
 
         result = math.sqrt(number)
-        self.history.append(f"√{number} = {result}")
+        self.history.append(("√", number, None, result))
         return result
 
+    @staticmethod
+    def format_entry(entry: HistoryEntry) -> str:
+        """
+        Render a history entry as text.
+
+        Args:
+            entry: (operator, a, b, result) history entry
+
+        Returns:
+            Entry formatted like "2 + 3 = 5" or "√16 = 4.0"
+        """
+        op, a, b, result = entry
+        if b is None:
+            return f"{op}{a} = {result}"
+        return f"{a} {op} {b} = {result}"
+
     def get_history(self) -> List[str]:
         """
         Get calculation history.
@@ -121,7 +159,7 @@ class Calculator:
         Returns:
             List of calculation history entries
         """
-        return self.history.copy()
+        return [self.format_entry(entry) for entry in self.history]
 
     def clear_history(self):
         """Clear calculation history."""
@@ -140,7 +178,50 @@ class Calculator:
         if not self.history:
             raise ValueError("No calculations performed yet")
 
-        # Extract the result from the last history entry
-        last_entry = self.history[-1]
-        result_str = last_entry.split(" = ")[-1]
-        return float(result_str)
+        return self.history[-1][3]
+
+    # Batch operations on NumPy arrays; these are not recorded in history
+
+    def add_array(self, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Element-wise sum of two arrays."""
+        _require_numpy()
+        return np.add(a, b)
+
+    def subtract_array(self, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Element-wise difference of two arrays."""
+        _require_numpy()
+        return np.subtract(a, b)
+
+    def multiply_array(self, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """Element-wise product of two arrays."""
+        _require_numpy()
+        return np.multiply(a, b)
+
+    def divide_array(self, a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+        """
+        Element-wise quotient of two arrays.
+
+        Raises:
+            ValueError: If any divisor is zero
+        """
+        _require_numpy()
+        if not np.all(b):
+            raise ValueError("Cannot divide by zero")
+        return np.true_divide(a, b)
+
+    def power_array(self, base: "np.ndarray", exponent: "np.ndarray") -> "np.ndarray":
+        """Element-wise base raised to exponent, as floats like power()."""
+        _require_numpy()
+        return np.power(base, exponent, dtype=np.float64)
+
+    def sqrt_array(self, numbers: "np.ndarray") -> "np.ndarray":
+        """
+        Element-wise square root of an array.
+
+        Raises:
+            ValueError: If any number is negative
+        """
+        _require_numpy()
+        if np.any(np.less(numbers, 0)):
+            raise ValueError("Cannot calculate square root of negative number")
+        return np.sqrt(numbers)
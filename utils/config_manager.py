@@ -2,25 +2,90 @@
 Configuration manager for the automation framework.
 """
 
+import copy
 import json
 import os
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Load environment variables from .env file
 load_dotenv()
 
 
+@lru_cache(maxsize=None)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; mtime_ns is part of the cache key only."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Load a YAML file, parsing it again only when it changes on disk."""
+    # Callers merge the result into live config, so hand out a private copy
+    return copy.deepcopy(_parse_yaml(str(path), path.stat().st_mtime_ns))
+
+
+_MISSING = object()
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable; anything but "true" is False."""
+    return value.strip().lower() == "true"
+
+
+def _parse_int(value: str) -> Any:
+    """Parse an integer, keeping the raw string (e.g. "auto") if it is not one."""
+    try:
+        return int(value.strip())
+    except ValueError:
+        return value
+
+
 class ConfigManager:
     """Manages configuration for different environments and test settings."""
 
+    # env var -> (section getter, key, parser), resolved once at import
+    _ENV_TABLE = tuple(
+        (env_var, itemgetter(section), key, parse)
+        for env_var, (section, key), parse in (
+            ("WEB_BASE_URL", ("web", "base_url"), str),
+            ("API_BASE_URL", ("api", "base_url"), str),
+            ("DATABASE_URL", ("database", "url"), str),
+            ("BROWSER_NAME", ("browser", "name"), str),
+            ("BROWSER_HEADLESS", ("browser", "headless"), _parse_bool),
+            ("IMPLICIT_WAIT", ("web", "implicit_wait"), _parse_int),
+            ("EXPLICIT_WAIT", ("web", "explicit_wait"), _parse_int),
+            ("PAGE_LOAD_TIMEOUT", ("web", "page_load_timeout"), _parse_int),
+            ("PAGE_LOAD_STRATEGY", ("browser", "page_load_strategy"), str),
+            ("API_TIMEOUT", ("api", "timeout"), _parse_int),
+            ("LOG_LEVEL", ("logging", "level"), str),
+            ("PARALLEL_WORKERS", ("parallel", "workers"), _parse_int),
+            ("RETRY_COUNT", ("retry", "max_retries"), _parse_int),
+            (
+                "SCREENSHOT_ON_FAILURE",
+                ("reporting", "screenshot_on_failure"),
+                _parse_bool,
+            ),
+            ("VIDEO_RECORDING", ("reporting", "video_recording"), _parse_bool),
+        )
+    )
+
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         self._config = None
+        # dotted key -> resolved value (or _MISSING), cleared whenever config changes
+        self._get_cache: Dict[str, Any] = {}
         self._load_config()
 
     def _load_config(self):
@@ -52,6 +117,7 @@ class ConfigManager:
                 "headless": True,
                 "download_path": "./downloads",
                 "user_agent": None,
+                "page_load_strategy": "eager",
             },
             "mobile": {
                 "platform": "Android",
@@ -81,88 +147,67 @@ class ConfigManager:
             env = "ci"
         else:
             env = os.getenv("TEST_ENV", "local")
-        
+
         env_config_file = self.config_dir / f"{env}.yaml"
 
         if env_config_file.exists():
-            with open(env_config_file, "r") as f:
-                env_config = yaml.safe_load(f) or {}
-                self._merge_config(default_config, env_config)
+            self._merge_config(default_config, _load_yaml(env_config_file))
         else:
             # Fallback to local.yaml if environment-specific config doesn't exist
             local_config_file = self.config_dir / "local.yaml"
             if local_config_file.exists():
-                with open(local_config_file, "r") as f:
-                    env_config = yaml.safe_load(f) or {}
-                    self._merge_config(default_config, env_config)
+                self._merge_config(default_config, _load_yaml(local_config_file))
 
         # Override with environment variables
         self._override_with_env_vars(default_config)
 
         self._config = default_config
+        self._get_cache.clear()
 
     def _merge_config(self, base_config: Dict, override_config: Dict):
-        """Recursively merge configuration dictionaries."""
-        for key, value in override_config.items():
-            if (
-                key in base_config
-                and isinstance(base_config[key], dict)
-                and isinstance(value, dict)
-            ):
-                self._merge_config(base_config[key], value)
-            else:
-                base_config[key] = value
+        """Deep-merge override_config into base_config in place."""
+        stack = [(base_config, override_config)]
+        while stack:
+            base, override = stack.pop()
+            for key, value in override.items():
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
 
     def _override_with_env_vars(self, config: Dict):
         """Override configuration with environment variables."""
-        env_mappings = {
-            "WEB_BASE_URL": ("web", "base_url"),
-            "API_BASE_URL": ("api", "base_url"),
-            "DATABASE_URL": ("database", "url"),
-            "BROWSER_NAME": ("browser", "name"),
-            "BROWSER_HEADLESS": ("browser", "headless"),
-            "IMPLICIT_WAIT": ("web", "implicit_wait"),
-            "EXPLICIT_WAIT": ("web", "explicit_wait"),
-            "PAGE_LOAD_TIMEOUT": ("web", "page_load_timeout"),
-            "API_TIMEOUT": ("api", "timeout"),
-            "LOG_LEVEL": ("logging", "level"),
-            "PARALLEL_WORKERS": ("parallel", "workers"),
-            "RETRY_COUNT": ("retry", "max_retries"),
-            "SCREENSHOT_ON_FAILURE": ("reporting", "screenshot_on_failure"),
-            "VIDEO_RECORDING": ("reporting", "video_recording"),
-        }
-
-        for env_var, config_path in env_mappings.items():
-            env_value = os.getenv(env_var)
+        environ = os.environ
+        for env_var, get_section, key, parse in self._ENV_TABLE:
+            env_value = environ.get(env_var)
             if env_value is not None:
-                # Navigate to the nested config location
-                current = config
-                for key in config_path[:-1]:
-                    current = current[key]
-
-                # Convert string values to appropriate types
-                if env_value.lower() in ("true", "false"):
-                    env_value = env_value.lower() == "true"
-                elif env_value.isdigit():
-                    env_value = int(env_value)
-
-                current[config_path[-1]] = env_value
+                get_section(config)[key] = parse(env_value)
 
     def get_config(self) -> Dict[str, Any]:
         """Get the complete configuration."""
         return self._config
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get a specific configuration value using dot notation."""
-        keys = key.split(".")
+        """
+        Get a specific configuration value using dot notation.
+
+        Lookups are memoized; change values through set() so the cache is reset.
+        """
+        value = self._get_cache.get(key, _MISSING)
+        if value is _MISSING and key not in self._get_cache:
+            value = self._get_cache[key] = self._walk(key)
+        return default if value is _MISSING else value
+
+    def _walk(self, key: str) -> Any:
+        """Resolve a dotted key against the config, or _MISSING if absent."""
         value = self._config
-
         try:
-            for k in keys:
+            for k in key.split("."):
                 value = value[k]
             return value
         except (KeyError, TypeError):
-            return default
+            return _MISSING
 
     def set(self, key: str, value: Any):
         """Set a configuration value using dot notation."""
@@ -175,6 +220,7 @@ class ConfigManager:
             current = current[k]
 
         current[keys[-1]] = value
+        self._get_cache.clear()
 
     def save_config(self, filename: str = None):
         """Save current configuration to a file."""
@@ -194,8 +240,7 @@ class ConfigManager:
         env_config_file = self.config_dir / f"{env}.yaml"
 
         if env_config_file.exists():
-            with open(env_config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(env_config_file)
 
         return {}
 
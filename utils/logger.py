@@ -11,6 +11,40 @@ from typing import Any, Optional
 
 from loguru import logger
 
+# Set once the stdlib root logger forwards to loguru
+_INTERCEPT_INSTALLED = False
+
+# Set by the first setup_logger call; configure_default does nothing afterwards
+_CONFIGURED = False
+
+_DEFAULT_FORMAT = (
+    "<green>{time:%Y-%m-%d %H:%M:%S}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+# Sinks added by setup_logger (0 is loguru's default stderr sink) and the
+# arguments they were added with; reconfiguring replaces only these
+_HANDLER_IDS = [0]
+_CURRENT_CONFIG = None
+
+# Third-party loggers that attach their own handlers; reset so they propagate
+_NOISY = (
+    "urllib3",
+    "selenium.webdriver.remote.remote_connection",
+    "webdriver_manager",
+    "asyncio",
+    "websockets",
+)
+
+
+# log_test_end dispatch: status -> (log method, message template)
+_STATUS_TABLE = {
+    "PASSED": (logger.info, "✅ Test completed: {}"),
+    "FAILED": (logger.error, "❌ Test failed: {}"),
+    "SKIPPED": (logger.warning, "⏭️ Test skipped: {}"),
+}
+
 
 class InterceptHandler(logging.Handler):
     """Intercept standard logging and redirect to loguru."""
@@ -34,7 +68,7 @@ class InterceptHandler(logging.Handler):
 def setup_logger(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    log_format: str = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+    log_format: str = _DEFAULT_FORMAT,
     rotation: str = "10 MB",
     retention: str = "30 days",
     compression: str = "zip",
@@ -53,11 +87,24 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    # Remove default handler
-    logger.remove()
+    global _INTERCEPT_INSTALLED, _CURRENT_CONFIG
+    global _CONFIGURED
+
+    # Same configuration as the sinks already installed: nothing to rebuild
+    config = (level, log_file, log_format, rotation, retention, compression)
+    if config == _CURRENT_CONFIG:
+        return logger
+
+    # Remove the sinks from the previous call (or loguru's default handler)
+    for handler_id in _HANDLER_IDS:
+        try:
+            logger.remove(handler_id)
+        except ValueError:
+            pass
+    _HANDLER_IDS.clear()
 
     # Add console handler
-    logger.add(
+    console_id = logger.add(
         sys.stdout,
         format=log_format,
         level=level,
@@ -65,6 +112,7 @@ def setup_logger(
         backtrace=True,
         diagnose=True,
     )
+    _HANDLER_IDS.append(console_id)
 
     # Add file handler if specified
     if log_file:
@@ -72,7 +120,8 @@ def setup_logger(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
+        # Writes, rotation and compression run on loguru's queue worker thread
+        file_id = logger.add(
             log_file,
             format=log_format,
             level=level,
@@ -81,16 +130,47 @@ def setup_logger(
             compression=compression,
             backtrace=True,
             diagnose=True,
+            enqueue=True,
+            catch=True,
         )
+        _HANDLER_IDS.append(file_id)
 
-    # Intercept standard logging
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    level_no = logger.level(level).no
 
-    # Intercept third-party loggers
-    for name in logging.root.manager.loggerDict:
-        logging.getLogger(name).handlers = []
-        logging.getLogger(name).propagate = True
+    # Intercept standard logging; the root level mirrors ``level`` so disabled
+    # stdlib records are dropped before formatting instead of inside loguru
+    if _INTERCEPT_INSTALLED:
+        logging.root.setLevel(level_no)
+    else:
+        logging.basicConfig(handlers=[InterceptHandler()], level=level_no, force=True)
+
+        # Intercept third-party loggers
+        for name in _NOISY:
+            noisy_logger = logging.getLogger(name)
+            noisy_logger.handlers = []
+            noisy_logger.propagate = True
+
+        _INTERCEPT_INSTALLED = True
 
+    _CURRENT_CONFIG = config
+    _CONFIGURED = True
+    return logger
+
+
+def configure_default() -> logger:
+    """
+    Configure console and file logging from LOG_LEVEL, once per process.
+
+    Does nothing if setup_logger has already run. Under pytest-xdist each worker
+    writes its own file so workers don't race on rotating a shared log.
+
+    Returns:
+        Configured logger instance
+    """
+    if not _CONFIGURED:
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        log_file = f"logs/test_{worker}.log" if worker else "logs/test.log"
+        setup_logger(level=os.getenv("LOG_LEVEL", "INFO"), log_file=log_file)
     return logger
 
 
@@ -109,31 +189,44 @@ def get_test_logger(name: str = None) -> logger:
     return logger
 
 
+def _level_enabled(level_no: int) -> bool:
+    """
+    Whether any loguru sink accepts records at level_no.
+
+    Read from loguru's core at call time so sinks added or removed with
+    logger.add/remove outside setup_logger are taken into account.
+    """
+    return logger._core.min_level <= level_no
+
+
+def _debug_enabled() -> bool:
+    """Whether DEBUG records reach any sink; helpers skip building them otherwise."""
+    return _level_enabled(logging.DEBUG)
+
+
 def log_test_start(test_name: str, test_params: dict = None):
     """Log test start information."""
-    logger.info(f"🚀 Starting test: {test_name}")
-    if test_params:
-        logger.debug(f"Test parameters: {test_params}")
+    logger.info("🚀 Starting test: {}", test_name)
+    if test_params and _debug_enabled():
+        logger.debug("Test parameters: {}", test_params)
 
 
 def log_test_end(test_name: str, status: str = "PASSED", duration: float = None):
     """Log test end information."""
-    if status.upper() == "PASSED":
-        logger.info(f"✅ Test completed: {test_name}")
-    elif status.upper() == "FAILED":
-        logger.error(f"❌ Test failed: {test_name}")
-    elif status.upper() == "SKIPPED":
-        logger.warning(f"⏭️ Test skipped: {test_name}")
+    entry = _STATUS_TABLE.get(status.upper())
+    if entry:
+        log, message = entry
+        log(message, test_name)
 
     if duration:
-        logger.info(f"⏱️ Test duration: {duration:.2f} seconds")
+        logger.info("⏱️ Test duration: {:.2f} seconds", duration)
 
 
 def log_step(step_name: str, step_details: str = None):
     """Log test step information."""
-    logger.info(f"📋 Step: {step_name}")
-    if step_details:
-        logger.debug(f"Step details: {step_details}")
+    logger.info("📋 Step: {}", step_name)
+    if step_details and _debug_enabled():
+        logger.debug("Step details: {}", step_details)
 
 
 def log_assertion(
@@ -144,21 +237,20 @@ def log_assertion(
 ):
     """Log assertion information."""
     if status.upper() == "PASSED":
-        logger.info(f"✅ Assertion passed: {assertion_name}")
-    else:
-        logger.error(f"❌ Assertion failed: {assertion_name}")
+        logger.info("✅ Assertion passed: {}", assertion_name)
+    elif _level_enabled(logging.ERROR):
+        logger.error("❌ Assertion failed: {}", assertion_name)
         if expected is not None and actual is not None:
-            logger.error(f"Expected: {expected}")
-            logger.error(f"Actual: {actual}")
+            logger.error("Expected: {}", expected)
+            logger.error("Actual: {}", actual)
 
 
 def log_api_request(method: str, url: str, headers: dict = None, data: Any = None):
     """Log API request information."""
-    logger.info(f"🌐 API Request: {method} {url}")
-    if headers:
-        logger.debug(f"Headers: {headers}")
-    if data:
-        logger.debug(f"Data: {data}")
+    logger.info("🌐 API Request: {} {}", method, url)
+    # Payloads and headers (credentials included) stay at DEBUG, in one record
+    if _debug_enabled() and (headers or data):
+        logger.debug("Request details | Headers: {} | Data: {}", headers, data)
 
 
 def log_api_response(
@@ -166,63 +258,61 @@ def log_api_response(
 ):
     """Log API response information."""
     if 200 <= status_code < 300:
-        logger.info(f"✅ API Response: {status_code}")
+        log, message = logger.info, "✅ API Response: {}"
     else:
-        logger.error(f"❌ API Response: {status_code}")
-
-    if response_data:
-        logger.debug(f"Response data: {response_data}")
-
+        log, message = logger.error, "❌ API Response: {}"
     if duration:
-        logger.info(f"⏱️ API call duration: {duration:.2f} seconds")
+        log(message + " | ⏱️ {:.2f} seconds", status_code, duration)
+    else:
+        log(message, status_code)
+
+    if response_data and _debug_enabled():
+        logger.debug("Response data: {}", response_data)
 
 
 def log_web_action(action: str, element_info: str = None, value: Any = None):
     """Log web automation actions."""
-    logger.info(f"🖥️ Web Action: {action}")
-    if element_info:
-        logger.debug(f"Element: {element_info}")
-    if value:
-        logger.debug(f"Value: {value}")
+    logger.info("🖥️ Web Action: {}", action)
+    if _debug_enabled():
+        if element_info:
+            logger.debug("Element: {}", element_info)
+        if value:
+            logger.debug("Value: {}", value)
 
 
 def log_database_query(query: str, params: dict = None, duration: float = None):
     """Log database query information."""
-    logger.info(f"🗄️ Database Query: {query}")
-    if params:
-        logger.debug(f"Parameters: {params}")
     if duration:
-        logger.info(f"⏱️ Query duration: {duration:.2f} seconds")
+        logger.info("🗄️ Database Query: {} | ⏱️ {:.2f} seconds", query, duration)
+    else:
+        logger.info("🗄️ Database Query: {}", query)
+
+    if params and _debug_enabled():
+        logger.debug("Parameters: {}", params)
 
 
 def log_performance_metric(metric_name: str, value: float, unit: str = "ms"):
     """Log performance metrics."""
-    logger.info(f"📊 Performance: {metric_name} = {value} {unit}")
+    logger.info("📊 Performance: {} = {} {}", metric_name, value, unit)
 
 
 def log_error(error: Exception, context: str = None):
     """Log error information."""
-    logger.error(f"💥 Error in {context or 'unknown context'}: {str(error)}")
+    logger.error("💥 Error in {}: {}", context or "unknown context", error)
     logger.exception(error)
 
 
 def log_warning(message: str, context: str = None):
     """Log warning information."""
-    logger.warning(f"⚠️ Warning in {context or 'unknown context'}: {message}")
+    logger.warning("⚠️ Warning in {}: {}", context or "unknown context", message)
 
 
 def log_info(message: str, context: str = None):
     """Log information message."""
-    logger.info(f"ℹ️ Info in {context or 'unknown context'}: {message}")
+    logger.info("ℹ️ Info in {}: {}", context or "unknown context", message)
 
 
 def log_debug(message: str, context: str = None):
     """Log debug message."""
-    logger.debug(f"🔍 Debug in {context or 'unknown context'}: {message}")
-
-
-# Create logs directory
-os.makedirs("logs", exist_ok=True)
-
-# Setup default logger
-setup_logger(level=os.getenv("LOG_LEVEL", "INFO"), log_file="logs/test.log")
+    if _debug_enabled():
+        logger.debug("🔍 Debug in {}: {}", context or "unknown context", message)